@@ -4,7 +4,7 @@ Example: Accessing Files from AWS S3
 This example demonstrates how to:
 1. Initialize S3 access with credentials
 2. List files in a bucket/prefix
-3. Read a file from S3
+3. Find and read a file from S3
 
 Note: You need valid AWS credentials to run this example.
 """
@@ -67,29 +67,32 @@ def main():
         print(f"         Modified: {file_info['last_modified']}")
 
     # Step 3: Read a specific file
-    if list_result['count'] > 0:
-        # Read the first .rpt file found
-        rpt_files = [f for f in list_result['files'] if f['key'].endswith('.rpt')]
-
-        if rpt_files:
-            print(f"\n3. Reading report file...")
-            file_to_read = rpt_files[0]['key']
-            print(f"   File: {file_to_read}")
-
-            read_result = s3_access.on_receive({
-                "operation": "read_file",
-                "key": file_to_read,
-                "decode": True
-            })
-
-            if read_result['status'] == 'error':
-                print(f"   Error: {read_result['message']}")
-            else:
-                print(f"   Successfully read file ({read_result['size']} bytes)")
-                print("\n   First 500 characters:")
-                print("   " + "-" * 56)
-                print(read_result['content'][:500])
-                print("   " + "-" * 56)
+    # Find the first .rpt file - stops at the first match instead of listing everything
+    find_result = s3_access.on_receive({
+        "operation": "find_first",
+        "prefix": PREFIX,
+        "suffix": ".rpt"
+    })
+
+    if find_result['status'] == 'success' and find_result['found']:
+        print(f"\n3. Reading report file...")
+        file_to_read = find_result['file']['key']
+        print(f"   File: {file_to_read}")
+
+        read_result = s3_access.on_receive({
+            "operation": "read_file",
+            "key": file_to_read,
+            "decode": True
+        })
+
+        if read_result['status'] == 'error':
+            print(f"   Error: {read_result['message']}")
+        else:
+            print(f"   Successfully read file ({read_result['size']} bytes)")
+            print("\n   First 500 characters:")
+            print("   " + "-" * 56)
+            print(read_result['content'][:500])
+            print("   " + "-" * 56)
 
     # Alternative: Read using full S3 path
     print("\n4. Alternative: Reading using full S3 path...")
@@ -99,8 +102,19 @@ def main():
     print(f"       's3_path': 's3://{BUCKET}/{PREFIX}2025-01-15T143000Z/network_mod.rpt'")
     print(f"   }})")
 
+    # Alternative: Stream a large binary file instead of reading it into memory
+    print("\n5. Alternative: Streaming a binary file...")
+    print("   Example (not executed):")
+    print("   result = s3_access.on_receive({")
+    print("       'operation': 'read_file',")
+    print(f"       's3_path': 's3://{BUCKET}/{PREFIX}2025-01-15T143000Z/network_mod.out',")
+    print("       'stream': True")
+    print("   })")
+    print("   for chunk in result['stream'].iter_chunks(chunk_size=1024 * 1024):")
+    print("       ...  # process raw bytes")
+
     # Cleanup
-    print("\n5. Cleaning up...")
+    print("\n6. Cleaning up...")
     s3_access.on_destroy()
 
     print("\n" + "=" * 60)
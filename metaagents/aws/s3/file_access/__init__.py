@@ -0,0 +1,5 @@
+"""S3 File Access Metaagent Package"""
+from . import metaagent
+from .metaagent import to_json_bytes
+
+__all__ = ['metaagent', 'to_json_bytes']
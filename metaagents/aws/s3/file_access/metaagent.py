@@ -13,27 +13,93 @@ from __future__ import annotations
 
 # --- dataclass runtime guard (fixes NoneType __dict__ crash) ---
 import sys, types
-if not isinstance(__name__, str) or __name__ not in sys.modules:
-    module_name = "xmtwin_runtime"  # any stable name is fine
+_loaded_by_guard = not isinstance(__name__, str) or __name__ not in sys.modules
+if _loaded_by_guard:
+    module_name = "xmtwin_runtime_s3_file_access"  # any stable name unique to this file is fine
     globals()["__name__"] = module_name
+    # Register a module that resolves names from these globals, so functions
+    # defined below can be pickled by reference for worker processes
+    _guard_globals = globals()
+
+    def _guard_getattr(name):
+        try:
+            return _guard_globals[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
     mod = types.ModuleType(module_name)
-    mod.__dict__.update(globals())
+    mod.__getattr__ = _guard_getattr
     sys.modules[module_name] = mod
 # --- end guard ---
 
+import asyncio
 import json
 import logging
-from dataclasses import dataclass
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, repeat
 from typing import Any
 from io import BytesIO
 
+# boto3 is imported once at module load (it is slow to import) rather than in on_create
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig, create_transfer_manager
+    from botocore.config import Config
+    _BOTO3_AVAILABLE = True
+except ImportError:
+    _BOTO3_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# 's3://bucket/key' or 'bucket/key' - the key may be empty
+_S3_PATH_RE = re.compile(r'^(?:s3://)?([^/]+)(?:/(.*))?$', re.DOTALL)
+
+# Botocore client settings - a pool large enough for concurrent transfers and
+# listings, plus adaptive retries so bursts survive S3 throttling
+S3_CLIENT_CONFIG = {
+    "max_pool_connections": 64,
+    "retries": {"mode": "adaptive", "max_attempts": 10},
+    "tcp_keepalive": True,
+    "connect_timeout": 3,
+    "read_timeout": 60
+}
+
+# Multipart download settings (boto3 TransferConfig). "auto" lets boto3 pick the
+# AWS CRT transfer client when awscrt is installed and the host benefits from it.
+S3_TRANSFER_CONFIG = {
+    "multipart_threshold": 8 * 1024 * 1024,
+    "multipart_chunksize": 8 * 1024 * 1024,
+    "max_concurrency": 10,
+    "io_chunksize": 1024 * 1024,
+    "preferred_transfer_client": "auto"
+}
+
+# Chunk size for reading response bodies into a preallocated buffer
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Text files larger than this are returned undecoded when lazy decoding is requested
+LAZY_DECODE_THRESHOLD = 1024 * 1024
 
 # --- Data Classes ---
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__. They need Python 3.10+, and
+# frozen ones only pickle correctly (for the process pool) from 3.11.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 11) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class S3Config:
     """Configuration for S3 connection."""
     aws_access_key_id: str
@@ -43,22 +109,131 @@ class S3Config:
 
 
 @dataclass
+class ObjectCache:
+    """Size-bounded LRU cache of small S3 objects, validated by ETag."""
+    max_bytes: int = 64 * 1024 * 1024
+    entries: OrderedDict = field(default_factory=OrderedDict)  # (bucket, key) -> (etag, content)
+    total_bytes: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __contains__(self, bucket_key: tuple[str, str]) -> bool:
+        """Whether an entry (of any ETag) is cached for (bucket, key)."""
+        return bucket_key in self.entries
+
+    def get(self, bucket: str, key: str, etag: str) -> memoryview | None:
+        """Return cached content if present and still matching etag."""
+        with self.lock:
+            entry = self.entries.get((bucket, key))
+            if entry is None or entry[0] != etag:
+                return None
+            self.entries.move_to_end((bucket, key))
+            return entry[1]
+
+    def put(self, bucket: str, key: str, etag: str, content: memoryview) -> None:
+        """Store content, evicting least recently used entries to stay within max_bytes."""
+        if len(content) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop((bucket, key), None)
+            if old is not None:
+                self.total_bytes -= len(old[1])
+            self.entries[(bucket, key)] = (etag, content)
+            self.total_bytes += len(content)
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove all cached objects."""
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class S3State:
     """Global state management for the metaagent."""
     config: S3Config | None = None
+    session: Any = None  # boto3 Session, for building additional clients
     s3_client: Any = None
+    transfer_manager: Any = None  # boto3 TransferManager for large downloads
+    cache: ObjectCache | None = None
 
     def reset(self) -> None:
         """Reset state to initial condition."""
+        if self.transfer_manager is not None:
+            self.transfer_manager.shutdown()
+        if self.cache is not None:
+            self.cache.clear()
         self.config = None
+        self.session = None
         self.s3_client = None
+        self.transfer_manager = None
+        self.cache = None
+
+
+class LazyDecodedContent:
+    """
+    UTF-8 file contents that are only decoded where they are used.
+
+    Slicing decodes just the requested byte range, so previewing the start of
+    a large (ASCII) report does not decode the whole body. str() decodes all
+    of it. Offsets are byte offsets, which match character offsets for ASCII.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: bytes | memoryview):
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int | slice) -> str:
+        if isinstance(index, slice):
+            return str(self._data[index], 'utf-8', 'replace')
+        return bytes((self._data[index],)).decode('utf-8', errors='replace')
+
+    def __str__(self) -> str:
+        return str(self._data, 'utf-8', 'replace')
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyDecodedContent({len(self._data)} bytes)"
 
 
 # Global state instance
 _state = S3State()
 
+# Per-process S3 client used by process pool workers
+_worker_s3_client: Any = None
+
 
 # --- Helper Functions ---
+def to_json_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes, ready to upload to S3.
+
+    Uses orjson when installed (several times faster than the json module, and
+    it also handles datetimes and numpy arrays); otherwise falls back to json.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # e.g. non-str dict keys or ints beyond 64 bits, which json accepts
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+@lru_cache(maxsize=1024)
 def _parse_s3_path(s3_path: str) -> tuple[str, str]:
     """
     Parse S3 path into bucket and key.
@@ -68,79 +243,491 @@ def _parse_s3_path(s3_path: str) -> tuple[str, str]:
 
     Returns:
         Tuple of (bucket, key)
-    """
-    if s3_path.startswith('s3://'):
-        s3_path = s3_path[5:]
 
-    parts = s3_path.split('/', 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
-    elif len(parts) == 1:
-        return parts[0], ''
-    else:
+    Raises:
+        ValueError: If no bucket can be found in the path
+    """
+    match = _S3_PATH_RE.match(s3_path)
+    if not match:
         raise ValueError(f"Invalid S3 path: {s3_path}")
 
-
-def read_file_from_s3(s3_client: Any, bucket: str, key: str, decode: bool = True) -> str | bytes:
+    bucket, key = match.groups()
+    return bucket, key or ''
+
+
+def _read_body_into_buffer(body: Any, size: int) -> memoryview:
+    """Read a StreamingBody in chunks into one preallocated buffer and return a view of it."""
+    view = memoryview(bytearray(size))
+    pos = 0
+    while pos < size:
+        chunk = body.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        view[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+    return view[:pos]
+
+
+def read_file_from_s3(
+    s3_client: Any,
+    bucket: str,
+    key: str,
+    decode: bool = True,
+    transfer_manager: Any = None,
+    lazy_decode: bool = False,
+    cache: ObjectCache | None = None
+) -> str | memoryview | LazyDecodedContent:
     """
     Read a file from S3.
 
+    Objects at or above the multipart threshold are downloaded through a boto3
+    TransferManager, which fetches byte ranges concurrently so large files are
+    not limited to a single TCP stream. Every read starts with a plain GET;
+    only when its ContentLength reaches the threshold is that stream dropped
+    for the TransferManager, so small objects cost exactly one request.
+    Either way the body lands in one buffer that is returned without copying.
+
+    With a cache, small objects are kept after the first read. Reads of a
+    cached object HEAD it instead and skip the GET while its ETag is unchanged.
+
     Args:
         s3_client: Boto3 S3 client instance
         bucket: S3 bucket name
         key: S3 object key
-        decode: If True, decode as UTF-8 string; if False, return bytes
+        decode: If True, decode as UTF-8 string; if False, return raw bytes
+        transfer_manager: Optional shared TransferManager for large downloads
+        lazy_decode: If True, text files over LAZY_DECODE_THRESHOLD are returned
+            as LazyDecodedContent instead of being decoded up front
+        cache: Optional ObjectCache for objects below the multipart threshold
 
     Returns:
-        File contents as string or bytes
+        File contents as string, LazyDecodedContent, or (decode=False) a
+        memoryview of the raw bytes - use bytes() for an immutable copy.
+        Invalid UTF-8 bytes are replaced rather than raising.
 
     Raises:
         Exception: If file cannot be read from S3
     """
     try:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        content = response['Body'].read()
+        content = None
+        if cache is not None and (bucket, key) in cache:
+            # Revalidate the cached copy; a changed object falls through to the GET
+            head = s3_client.head_object(Bucket=bucket, Key=key)
+            content = cache.get(bucket, key, head['ETag'])
+
+        if content is None:
+            response = s3_client.get_object(Bucket=bucket, Key=key)
+            size = response['ContentLength']
+            if size < S3_TRANSFER_CONFIG['multipart_threshold']:
+                content = _read_body_into_buffer(response['Body'], size)
+                if cache is not None:
+                    # Read-only so callers cannot modify the cached copy
+                    content = content.toreadonly()
+                    cache.put(bucket, key, response['ETag'], content)
+            else:
+                # Large object - drop the single stream and fetch ranges concurrently
+                response['Body'].close()
+                buffer = BytesIO()
+                if transfer_manager is not None:
+                    transfer_manager.download(bucket, key, buffer).result()
+                else:
+                    s3_client.download_fileobj(bucket, key, buffer, Config=TransferConfig(**S3_TRANSFER_CONFIG))
+                content = buffer.getbuffer()
 
         if decode:
-            return content.decode('utf-8')
+            if lazy_decode and len(content) > LAZY_DECODE_THRESHOLD:
+                return LazyDecodedContent(content)
+            return str(content, 'utf-8', 'replace')
         else:
             return content
 
     except Exception as e:
-        logger.error(f"Failed to read s3://{bucket}/{key}: {e}")
+        logger.error("Failed to read s3://%s/%s: %s", bucket, key, e, extra={'bucket': bucket, 'key': key})
         raise
 
 
-def list_files_in_s3_prefix(s3_client: Any, bucket: str, prefix: str) -> list[dict[str, Any]]:
+def batch_read_files_from_s3(
+    s3_client: Any,
+    bucket: str,
+    keys: list[str],
+    decode: bool = True,
+    max_workers: int = 32,
+    transfer_manager: Any = None,
+    cache: ObjectCache | None = None
+) -> dict[str, str | memoryview]:
+    """
+    Read many files from S3 concurrently.
+
+    Each read is still one request, but the HTTPS round trips overlap across a
+    thread pool sharing the client's connection pool. For many small objects
+    (e.g. JSON alert files) this is an order of magnitude faster than reading
+    them one at a time.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        keys: S3 object keys to read
+        decode: If True, decode as UTF-8 strings; if False, return raw bytes
+        max_workers: Maximum number of concurrent reads
+        transfer_manager: Optional shared TransferManager for large downloads
+        cache: Optional ObjectCache shared by the reads
+
+    Returns:
+        Dict of key -> file contents (str, or memoryview when not decoding),
+        in the order of keys
+
+    Raises:
+        Exception: If any file cannot be read from S3
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(
+            lambda key: read_file_from_s3(s3_client, bucket, key, decode, transfer_manager, cache=cache),
+            keys
+        )
+        return dict(zip(keys, contents))
+
+
+async def _batch_read_files_async(
+    config: S3Config,
+    bucket: str,
+    keys: list[str],
+    decode: bool = True,
+    max_concurrency: int = 32
+) -> dict[str, str | bytes]:
+    """
+    Read many files from S3 on a single event loop using aioboto3.
+
+    Requires the optional aioboto3 package. A single event loop keeps hundreds
+    of GETs in flight without one thread per request.
+
+    Args:
+        config: S3 configuration with credentials and region
+        bucket: S3 bucket name
+        keys: S3 object keys to read
+        decode: If True, decode as UTF-8 strings; if False, return bytes
+        max_concurrency: Maximum number of in-flight requests
+
+    Returns:
+        Dict of key -> file contents, in the order of keys
+    """
+    import aioboto3
+
+    session = aioboto3.Session(
+        aws_access_key_id=config.aws_access_key_id,
+        aws_secret_access_key=config.aws_secret_access_key,
+        region_name=config.region_name
+    )
+    client_config = Config(**{**S3_CLIENT_CONFIG, "max_pool_connections": max_concurrency})
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with session.client("s3", config=client_config) as s3_client:
+        async def read(key: str) -> str | bytes:
+            async with semaphore:
+                response = await s3_client.get_object(Bucket=bucket, Key=key)
+                async with response['Body'] as stream:
+                    content = await stream.read()
+            return content.decode('utf-8', errors='replace') if decode else content
+
+        contents = await asyncio.gather(*(read(key) for key in keys))
+
+    return dict(zip(keys, contents))
+
+
+def _init_read_worker(config: S3Config) -> None:
+    """Process pool initializer - create this worker's own S3 client."""
+    global _worker_s3_client
+
+    _worker_s3_client = boto3.client(
+        "s3",
+        aws_access_key_id=config.aws_access_key_id,
+        aws_secret_access_key=config.aws_secret_access_key,
+        region_name=config.region_name,
+        config=Config(**S3_CLIENT_CONFIG)
+    )
+
+
+def _read_worker(bucket: str, key: str, decode: bool) -> str | bytes:
+    """Process pool task - read one file with this worker's S3 client."""
+    content = read_file_from_s3(_worker_s3_client, bucket, key, decode)
+    # memoryviews cannot be pickled back to the parent process
+    return content if decode else bytes(content)
+
+
+def _process_pool(max_workers: int, **kwargs) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers can run this module's functions.
+
+    When the runtime guard registered the module, workers cannot import it by
+    name, so they are forked (inheriting the registration) instead of spawned.
+
+    Raises:
+        RuntimeError: If the module was loaded by the guard and fork is unavailable
+    """
+    if not _loaded_by_guard:
+        return ProcessPoolExecutor(max_workers=max_workers, **kwargs)
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("use_processes needs the 'fork' start method when the metaagent is not importable by name")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"), **kwargs)
+
+
+def batch_read_files_in_processes(
+    config: S3Config,
+    bucket: str,
+    keys: list[str],
+    decode: bool = True,
+    max_workers: int = 8
+) -> dict[str, str | bytes]:
+    """
+    Read many files from S3 across a pool of worker processes.
+
+    Each worker builds its own S3 client once, in the pool initializer. Use this
+    when decoding large files is CPU-heavy enough for the GIL to limit the
+    thread pool in batch_read_files_from_s3.
+
+    Args:
+        config: S3 configuration with credentials and region
+        bucket: S3 bucket name
+        keys: S3 object keys to read
+        decode: If True, decode as UTF-8 strings; if False, return bytes
+        max_workers: Number of worker processes
+
+    Returns:
+        Dict of key -> file contents, in the order of keys
+
+    Raises:
+        RuntimeError: If worker processes cannot run this module (see _process_pool)
+        Exception: If any file cannot be read from S3
+    """
+    with _process_pool(
+        max_workers,
+        initializer=_init_read_worker,
+        initargs=(config,)
+    ) as executor:
+        contents = executor.map(
+            _read_worker,
+            repeat(bucket, len(keys)),
+            keys,
+            repeat(decode, len(keys))
+        )
+        return dict(zip(keys, contents))
+
+
+def open_file_stream_from_s3(s3_client: Any, bucket: str, key: str) -> tuple[Any, int]:
+    """
+    Open an S3 object for streaming without reading it into memory.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        key: S3 object key
+
+    Returns:
+        Tuple of (botocore StreamingBody, content length in bytes)
+
+    Raises:
+        Exception: If the object cannot be opened
+    """
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+        return response['Body'], response['ContentLength']
+
+    except Exception as e:
+        logger.error("Failed to open s3://%s/%s: %s", bucket, key, e, extra={'bucket': bucket, 'key': key})
+        raise
+
+
+def _file_info(obj: dict[str, Any]) -> dict[str, Any]:
+    """Convert a list_objects_v2 Contents entry into a file information dict."""
+    return {
+        'key': obj['Key'],
+        'size': obj['Size'],
+        'last_modified': obj['LastModified'].isoformat()
+    }
+
+
+def _file_row(obj: dict[str, Any]) -> tuple[str, int, str]:
+    """Convert a list_objects_v2 Contents entry into a (key, size, last_modified) tuple."""
+    return obj['Key'], obj['Size'], obj['LastModified'].isoformat()
+
+
+# Row builders for list results - tuples avoid a dict allocation per object
+_FILE_ROW_BUILDERS = {
+    'dicts': _file_info,
+    'tuples': _file_row,
+}
+
+# Column order of 'tuples' rows
+FILE_ROW_COLUMNS = ['key', 'size', 'last_modified']
+
+
+def _list_one_prefix(
+    s3_client: Any,
+    bucket: str,
+    prefix: str,
+    row_format: str = 'dicts'
+) -> list[dict[str, Any]] | list[tuple[str, int, str]]:
+    """
+    List every object under a single S3 prefix, following pagination.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        prefix: S3 prefix (folder path)
+        row_format: 'dicts' or 'tuples' (see list_files_in_s3_prefix)
+
+    Returns:
+        List of file rows
+    """
+    build_row = _FILE_ROW_BUILDERS[row_format]
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+    return [build_row(obj) for page in pages for obj in page.get('Contents', [])]
+
+
+def _list_delimited(
+    s3_client: Any,
+    bucket: str,
+    prefix: str,
+    delimiter: str,
+    include_files: bool = True,
+    row_format: str = 'dicts'
+) -> tuple[list[dict[str, Any]] | list[tuple[str, int, str]], list[str]]:
+    """
+    List one level of an S3 prefix, letting S3 roll deeper keys up into CommonPrefixes.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        prefix: S3 prefix (folder path)
+        delimiter: Delimiter used to group keys (usually '/')
+        include_files: If False, objects directly under the prefix are skipped
+        row_format: 'dicts' or 'tuples' (see list_files_in_s3_prefix)
+
+    Returns:
+        Tuple of (file rows, sub-prefix strings)
+    """
+    build_row = _FILE_ROW_BUILDERS[row_format]
+    paginator = s3_client.get_paginator('list_objects_v2')
+    files = []
+    prefixes = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter):
+        if include_files:
+            files.extend(build_row(obj) for obj in page.get('Contents', []))
+        prefixes.extend(cp['Prefix'] for cp in page.get('CommonPrefixes', []))
+    return files, prefixes
+
+
+def list_files_in_s3_prefix(
+    s3_client: Any,
+    bucket: str,
+    prefix: str,
+    parallel_prefixes: int | None = None,
+    delimiter: str | None = None,
+    prefixes_only: bool = False,
+    row_format: str = 'dicts'
+) -> list[dict[str, Any]] | list[tuple[str, int, str]]:
     """
     List all files in an S3 prefix.
 
+    Results are paginated, so prefixes with more than 1000 objects are listed
+    in full. When parallel_prefixes is set, the immediate sub-prefixes (as
+    returned with Delimiter='/') are listed concurrently, one worker each.
+
+    When delimiter is set, only one level is listed: objects directly under the
+    prefix are returned as file dicts and everything deeper is aggregated by S3
+    into {'prefix': ...} entries. This is O(#folders) rather than O(#objects).
+
     Args:
         s3_client: Boto3 S3 client instance
         bucket: S3 bucket name
         prefix: S3 prefix (folder path)
+        parallel_prefixes: Optional number of worker threads for sub-prefix fan-out
+        delimiter: Optional delimiter for a single-level listing (usually '/')
+        prefixes_only: With a delimiter, return only the {'prefix': ...} entries
+        row_format: 'dicts' for {'key', 'size', 'last_modified'} dicts, or
+            'tuples' for (key, size, last_modified) tuples - cheaper for large listings
 
     Returns:
-        List of file information dicts with 'key', 'size', and 'last_modified'
+        List of file rows, followed by {'prefix': ...} dicts when a delimiter is given
+
+    Raises:
+        ValueError: If row_format is not 'dicts' or 'tuples'
     """
+    if row_format not in _FILE_ROW_BUILDERS:
+        raise ValueError(f"Unknown row format: {row_format}. Supported: dicts, tuples")
+
     try:
-        response = s3_client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        if delimiter is not None:
+            files, prefixes = _list_delimited(
+                s3_client, bucket, prefix, delimiter,
+                include_files=not prefixes_only, row_format=row_format
+            )
+            return files + [{'prefix': sub_prefix} for sub_prefix in prefixes]
+
+        if not parallel_prefixes:
+            return _list_one_prefix(s3_client, bucket, prefix, row_format)
+
+        # Split the prefix into its immediate children, keeping files at this level
+        files, common_prefixes = _list_delimited(s3_client, bucket, prefix, '/', row_format=row_format)
+
+        with ThreadPoolExecutor(max_workers=parallel_prefixes) as executor:
+            nested = executor.map(
+                lambda sub_prefix: _list_one_prefix(s3_client, bucket, sub_prefix, row_format),
+                common_prefixes
+            )
+            files.extend(chain.from_iterable(nested))
 
-        if 'Contents' not in response:
-            return []
+        return files
 
-        files = []
-        for obj in response['Contents']:
-            files.append({
-                'key': obj['Key'],
-                'size': obj['Size'],
-                'last_modified': obj['LastModified'].isoformat()
-            })
+    except Exception as e:
+        logger.error(
+            "Failed to list files in s3://%s/%s: %s", bucket, prefix, e,
+            extra={'bucket': bucket, 'prefix': prefix}
+        )
+        raise
 
-        return files
+
+def find_first_file_in_s3_prefix(
+    s3_client: Any,
+    bucket: str,
+    prefix: str,
+    suffix: str,
+    max_pages: int = 10
+) -> dict[str, Any] | None:
+    """
+    Find the first file in an S3 prefix whose key ends with suffix.
+
+    Pages are requested lazily and the search stops at the first match, so
+    locating one file costs O(first hit) rather than a full listing.
+
+    Args:
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        prefix: S3 prefix (folder path)
+        suffix: Key suffix to match, e.g. '.rpt'
+        max_pages: Maximum number of 1000-key pages to scan
+
+    Returns:
+        File information dict with 'key', 'size', and 'last_modified', or None if not found
+    """
+    try:
+        paginator = s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={'PageSize': 1000})
+
+        for page_idx, page in enumerate(pages):
+            for obj in page.get('Contents', []):
+                if obj['Key'].endswith(suffix):
+                    return _file_info(obj)
+            if page_idx + 1 >= max_pages:
+                break
+
+        return None
 
     except Exception as e:
-        logger.error(f"Failed to list files in s3://{bucket}/{prefix}: {e}")
+        logger.error(
+            "Failed to search s3://%s/%s for *%s: %s", bucket, prefix, suffix, e,
+            extra={'bucket': bucket, 'prefix': prefix}
+        )
         raise
 
 
@@ -154,7 +741,9 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
         "aws_access_key_id": "YOUR_ACCESS_KEY",
         "aws_secret_access_key": "YOUR_SECRET_KEY",
         "region_name": "us-east-1",  # optional, defaults to us-east-1
-        "bucket": "your-bucket-name"  # optional, can be provided per request
+        "bucket": "your-bucket-name",  # optional, can be provided per request
+        "use_crt": false,  # optional - always use the AWS CRT client for large downloads (requires boto3[crt])
+        "cache_max_bytes": 67108864  # optional - size of the small-object read cache, 0 disables
     }
 
     Args:
@@ -170,6 +759,8 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
     aws_secret_access_key = data.get('aws_secret_access_key')
     region_name = data.get('region_name', 'us-east-1')
     bucket = data.get('bucket', '')
+    use_crt = bool(data.get('use_crt', False))
+    cache_max_bytes = int(data.get('cache_max_bytes', 64 * 1024 * 1024))
 
     if not aws_access_key_id or not aws_secret_access_key:
         return {
@@ -177,9 +768,13 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
             'message': 'aws_access_key_id and aws_secret_access_key are required'
         }
 
-    try:
-        import boto3
+    if not _BOTO3_AVAILABLE:
+        return {
+            'status': 'error',
+            'message': 'boto3 is required for the S3 file access metaagent (pip install boto3)'
+        }
 
+    try:
         # Create S3Config
         s3_config = S3Config(
             aws_access_key_id=aws_access_key_id,
@@ -188,18 +783,29 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
             bucket=bucket
         )
 
-        # Create S3 client
-        s3_client = boto3.client(
-            "s3",
+        # Create session and S3 client with a tuned connection pool
+        session = boto3.session.Session(
             aws_access_key_id=s3_config.aws_access_key_id,
             aws_secret_access_key=s3_config.aws_secret_access_key,
             region_name=s3_config.region_name
         )
+        s3_client = session.client("s3", config=Config(**S3_CLIENT_CONFIG))
+
+        # Shared transfer manager for multipart downloads of large files.
+        # boto3 falls back to the classic client if awscrt is not installed.
+        transfer_config = TransferConfig(**{
+            **S3_TRANSFER_CONFIG,
+            "preferred_transfer_client": "crt" if use_crt else "auto"
+        })
+        transfer_manager = create_transfer_manager(s3_client, transfer_config)
 
         _state.config = s3_config
+        _state.session = session
         _state.s3_client = s3_client
+        _state.transfer_manager = transfer_manager
+        _state.cache = ObjectCache(max_bytes=cache_max_bytes) if cache_max_bytes > 0 else None
 
-        logger.info(f"S3 metaagent initialized: region={region_name}")
+        logger.info("S3 metaagent initialized: region=%s", region_name)
 
         return {
             'status': 'initialized',
@@ -208,7 +814,7 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Failed to initialize S3 client: {e}")
+        logger.error("Failed to initialize S3 client: %s", e)
         return {
             'status': 'error',
             'message': str(e)
@@ -221,7 +827,7 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
 
     Expected data format:
     {
-        "operation": "read_file" | "list_files",
+        "operation": "read_file" | "batch_read_files" | "list_files" | "find_first",
 
         # For read_file operation:
         "s3_path": "s3://bucket/path/to/file" or "bucket/path/to/file",
@@ -229,13 +835,34 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
         "bucket": "bucket-name",
         "key": "path/to/file",
 
-        "decode": true,  # optional, default true - decode as UTF-8 string
+        "decode": true,  # optional, default true - decode as UTF-8 string, else memoryview of raw bytes
+        "stream": false,  # optional, default false - return an unread StreamingBody
+        "lazy_decode": false,  # optional - return large text files as LazyDecodedContent
+
+        # For batch_read_files operation:
+        "bucket": "bucket-name",  # optional, defaults to configured bucket
+        "keys": ["path/to/file1", "path/to/file2"],
+        "decode": true,
+        "max_workers": 32,  # optional - number of concurrent reads
+        "use_async": false,  # optional - read on an asyncio event loop (requires aioboto3)
+        "use_processes": false,  # optional - read in worker processes, one client each
 
         # For list_files operation:
         "s3_path": "s3://bucket/prefix/" or "bucket/prefix/",
         # OR
         "bucket": "bucket-name",
-        "prefix": "path/to/prefix/"
+        "prefix": "path/to/prefix/",
+        "mode": "files" | "prefixes" | "both",  # optional, default "files"
+        "format": "dicts" | "tuples",  # optional, default "dicts" - shape of each file entry
+        "parallel_prefixes": 8,  # optional - list sub-prefixes concurrently
+
+        # For find_first operation:
+        "s3_path": "s3://bucket/prefix/" or "bucket/prefix/",
+        # OR
+        "bucket": "bucket-name",
+        "prefix": "path/to/prefix/",
+        "suffix": ".rpt",
+        "max_pages": 10  # optional - stop after this many 1000-key pages
     }
 
     Args:
@@ -275,18 +902,84 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
 
             decode = data.get('decode', True)
 
-            content = read_file_from_s3(_state.s3_client, bucket, key, decode=decode)
+            if data.get('stream', False):
+                body, size = open_file_stream_from_s3(_state.s3_client, bucket, key)
+
+                return {
+                    'status': 'success',
+                    'operation': 'read_file',
+                    'bucket': bucket,
+                    'key': key,
+                    'stream': body,
+                    'size': size
+                }
+
+            content = read_file_from_s3(
+                _state.s3_client,
+                bucket,
+                key,
+                decode=decode,
+                transfer_manager=_state.transfer_manager,
+                lazy_decode=data.get('lazy_decode', False),
+                cache=_state.cache
+            )
 
             return {
                 'status': 'success',
                 'operation': 'read_file',
                 'bucket': bucket,
                 'key': key,
-                'content': content if decode else content.hex(),
+                'content': content,
                 'size': len(content),
                 'decoded': decode
             }
 
+        elif operation == 'batch_read_files':
+            bucket = data.get('bucket', _state.config.bucket)
+            keys = data.get('keys') or []
+
+            if not bucket or not keys:
+                return {
+                    'status': 'error',
+                    'message': 'Bucket and keys are required for batch_read_files operation'
+                }
+
+            decode = data.get('decode', True)
+
+            max_workers = data.get('max_workers', 32)
+
+            if data.get('use_async', False):
+                files = asyncio.run(
+                    _batch_read_files_async(_state.config, bucket, keys, decode, max_workers)
+                )
+            elif data.get('use_processes', False):
+                files = batch_read_files_in_processes(
+                    _state.config,
+                    bucket,
+                    keys,
+                    decode=decode,
+                    max_workers=data.get('max_workers', 8)
+                )
+            else:
+                files = batch_read_files_from_s3(
+                    _state.s3_client,
+                    bucket,
+                    keys,
+                    decode=decode,
+                    max_workers=max_workers,
+                    transfer_manager=_state.transfer_manager,
+                    cache=_state.cache
+                )
+
+            return {
+                'status': 'success',
+                'operation': 'batch_read_files',
+                'bucket': bucket,
+                'files': files,
+                'count': len(files),
+                'decoded': decode
+            }
+
         elif operation == 'list_files':
             # Get bucket and prefix
             s3_path = data.get('s3_path')
@@ -302,9 +995,41 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
                     'message': 'Bucket is required for list_files operation'
                 }
 
-            files = list_files_in_s3_prefix(_state.s3_client, bucket, prefix)
+            mode = data.get('mode', 'files')
+            if mode not in ('files', 'prefixes', 'both'):
+                return {
+                    'status': 'error',
+                    'message': f'Unknown list mode: {mode}. Supported: files, prefixes, both'
+                }
+
+            row_format = data.get('format', 'dicts')
+            if row_format not in _FILE_ROW_BUILDERS:
+                return {
+                    'status': 'error',
+                    'message': f'Unknown list format: {row_format}. Supported: dicts, tuples'
+                }
 
-            return {
+            if mode == 'files':
+                files = list_files_in_s3_prefix(
+                    _state.s3_client,
+                    bucket,
+                    prefix,
+                    parallel_prefixes=data.get('parallel_prefixes'),
+                    row_format=row_format
+                )
+                prefixes = None
+            else:
+                # Single-level listing - S3 aggregates sub-folders into CommonPrefixes
+                files, prefixes = _list_delimited(
+                    _state.s3_client,
+                    bucket,
+                    prefix,
+                    '/',
+                    include_files=mode == 'both',
+                    row_format=row_format
+                )
+
+            result = {
                 'status': 'success',
                 'operation': 'list_files',
                 'bucket': bucket,
@@ -312,15 +1037,58 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
                 'files': files,
                 'count': len(files)
             }
+            if row_format == 'tuples':
+                result['columns'] = FILE_ROW_COLUMNS
+            if prefixes is not None:
+                result['mode'] = mode
+                result['prefixes'] = prefixes
+                result['prefix_count'] = len(prefixes)
+
+            return result
+
+        elif operation == 'find_first':
+            # Get bucket and prefix
+            s3_path = data.get('s3_path')
+            if s3_path:
+                bucket, prefix = _parse_s3_path(s3_path)
+            else:
+                bucket = data.get('bucket', _state.config.bucket)
+                prefix = data.get('prefix', '')
+
+            suffix = data.get('suffix', '')
+
+            if not bucket or not suffix:
+                return {
+                    'status': 'error',
+                    'message': 'Bucket and suffix are required for find_first operation'
+                }
+
+            file_info = find_first_file_in_s3_prefix(
+                _state.s3_client,
+                bucket,
+                prefix,
+                suffix,
+                max_pages=data.get('max_pages', 10)
+            )
+
+            return {
+                'status': 'success',
+                'operation': 'find_first',
+                'bucket': bucket,
+                'prefix': prefix,
+                'suffix': suffix,
+                'file': file_info,
+                'found': file_info is not None
+            }
 
         else:
             return {
                 'status': 'error',
-                'message': f'Unknown operation: {operation}. Supported: read_file, list_files'
+                'message': f'Unknown operation: {operation}. Supported: read_file, batch_read_files, list_files, find_first'
             }
 
     except Exception as e:
-        logger.error(f"Operation failed: {e}", exc_info=True)
+        logger.error("Operation failed: %s", e, exc_info=True, extra={'operation': operation})
         return {
             'status': 'error',
             'message': str(e)
@@ -13,23 +13,130 @@ from __future__ import annotations
 
 # --- dataclass runtime guard (fixes NoneType __dict__ crash) ---
 import sys, types
-if not isinstance(__name__, str) or __name__ not in sys.modules:
-    module_name = "xmtwin_runtime"  # any stable name is fine
+_loaded_by_guard = not isinstance(__name__, str) or __name__ not in sys.modules
+if _loaded_by_guard:
+    module_name = "xmtwin_runtime_s3_file_writer"  # any stable name unique to this file is fine
     globals()["__name__"] = module_name
+    # Register a module that resolves names from these globals, so classes and
+    # functions defined below can be found (and pickled) by reference
+    _guard_globals = globals()
+
+    def _guard_getattr(name):
+        try:
+            return _guard_globals[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
     mod = types.ModuleType(module_name)
-    mod.__dict__.update(globals())
+    mod.__getattr__ = _guard_getattr
     sys.modules[module_name] = mod
 # --- end guard ---
 
+import asyncio
+import base64
+import gzip
+import importlib.util
 import json
 import logging
-from dataclasses import dataclass
+import mimetypes
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from io import BytesIO
 from typing import Any
 
+# boto3 is imported once at module load (it is slow to import) rather than in on_create
+try:
+    import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
+    _BOTO3_AVAILABLE = True
+except ImportError:
+    _BOTO3_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary serializers for content_format "msgpack" / "cbor"
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Optional hardware-accelerated CRC32C, used to precompute upload checksums
+try:
+    import google_crc32c
+except ImportError:
+    google_crc32c = None
+
+# botocore can only compute CRC32C itself (multipart uploads, or single PUTs
+# without google-crc32c) through the awscrt package
+_AWSCRT_AVAILABLE = importlib.util.find_spec("awscrt") is not None
+
+# Additional checksums S3 accepts on upload
+CHECKSUM_ALGORITHMS = ("CRC32", "CRC32C", "SHA1", "SHA256")
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# Botocore client settings - keep-alive sockets and a pool large enough that
+# bursts of on_receive calls reuse connections instead of new TLS handshakes
+S3_CLIENT_CONFIG = {
+    "max_pool_connections": 50,
+    "tcp_keepalive": True,
+    "retries": {"mode": "standard", "max_attempts": 5},
+    "connect_timeout": 3,
+    "read_timeout": 30
+}
+
+# Extra client settings for S3 Express One Zone directory buckets: regional
+# endpoints and SigV4, which the CreateSession-based auth requires
+S3_EXPRESS_CLIENT_CONFIG = {
+    "signature_version": "s3v4",
+    "s3": {"us_east_1_regional_endpoint": "regional"}
+}
+
+# Directory bucket names: <base-name>--<zone-id>--x-s3
+_EXPRESS_BUCKET_RE = re.compile(r"^[a-z0-9][a-z0-9-]*--[a-z0-9-]+--x-s3$")
+
+# Multipart upload settings (boto3 TransferConfig) for large payloads
+S3_TRANSFER_CONFIG = {
+    "multipart_threshold": 8 * 1024 * 1024,
+    "multipart_chunksize": 8 * 1024 * 1024,
+    "max_concurrency": 10,
+    "use_threads": True
+}
+
+# Serializations for dict/list content and the Content-Type stored with each.
+# JSON stays the default for external consumers; msgpack/CBOR are smaller
+# and faster to encode for pipelines whose readers are our own code.
+CONTENT_FORMATS = {
+    "json": "application/json",
+    "msgpack": "application/msgpack",
+    "cbor": "application/cbor"
+}
+
+# Gzip settings for compressed writes - level 1 keeps most of the size
+# reduction on JSON/text at a fraction of the default level's CPU cost.
+# Below GZIP_MIN_BYTES the gzip framing outweighs the savings.
+GZIP_COMPRESS_LEVEL = 1
+GZIP_MIN_BYTES = 1024
+
+# Built once at import so large writes don't construct it per call
+_TRANSFER_CONFIG = TransferConfig(**S3_TRANSFER_CONFIG) if _BOTO3_AVAILABLE else None
+
 
 # --- Data Classes ---
 @dataclass
@@ -39,251 +146,856 @@ class S3WriterConfig:
     aws_secret_access_key: str
     region_name: str = "us-east-1"
     bucket: str = ""
+    batch_size: int = 0  # 0 writes synchronously; > 0 queues writes for a background flusher
+    batch_flush_ms: int = 50  # longest a queued write waits for its batch to fill
+    batch_max_pending: int = 0  # queued writes before on_receive blocks; 0 = 4 x batch_size
+    max_concurrency: int = 10  # parallel PUTs per flushed batch
+    compress: bool = False  # gzip payloads and store them with Content-Encoding: gzip
+    checksum_algorithm: str = ""  # e.g. "CRC32C" to have S3 verify an additional checksum
+    content_format: str = "json"  # serialization for dict/list content, see CONTENT_FORMATS
+    express: bool = False  # bucket is an S3 Express One Zone directory bucket
+
+
+@dataclass
+class BatchWriter:
+    """
+    Background flusher that groups queued writes and uploads each batch in parallel.
+
+    A single thread drains the queue until batch_size items are collected or
+    flush_interval elapses, then sends the batch through a thread pool so
+    several PUTs are in flight at once over the shared client's pool. The
+    queue holds at most max_pending writes (0 = unbounded); submit blocks
+    when it is full, so producers cannot outrun the uploads.
+    """
+    s3_client: Any
+    bucket: str
+    batch_size: int
+    flush_interval: float
+    max_concurrency: int
+    compress: bool = False
+    checksum_algorithm: str = ""
+    max_pending: int = 0
+    pending: queue.Queue = field(init=False)
+    executor: ThreadPoolExecutor | None = None
+    thread: threading.Thread | None = None
+    written: int = 0
+    failed: int = 0
+    failed_keys: list[str] = field(default_factory=list)
+
+    _STOP = object()
+
+    def __post_init__(self) -> None:
+        self.pending = queue.Queue(maxsize=self.max_pending)
+
+    def start(self) -> None:
+        """Start the worker pool and the flusher thread."""
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="s3-writer"
+        )
+        self.thread = threading.Thread(target=self._run, name="s3-writer-flusher", daemon=True)
+        self.thread.start()
+
+    def submit(
+        self, key: str, body: bytes, content_type: str | None = None, compress: bool | None = None
+    ) -> None:
+        """
+        Queue a payload for upload, blocking while the queue is full.
+
+        compress overrides the writer's default for this payload.
+        """
+        self.pending.put((key, body, content_type, self.compress if compress is None else compress))
+
+    def close(self) -> dict[str, int]:
+        """
+        Flush everything still queued and stop the flusher.
+
+        Returns:
+            Dictionary with the number of written and failed uploads, and
+            the keys of the failed ones
+        """
+        self.pending.put(self._STOP)
+        self.thread.join()
+        self.executor.shutdown(wait=True)
+        return {'written': self.written, 'failed': self.failed, 'failed_keys': list(self.failed_keys)}
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self.pending.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Finish the batch before taking more work, so one batch is in flight
+            # at a time; the bounded queue is what holds producers back
+            for item, ok in zip(batch, self.executor.map(self._put, batch)):
+                if ok:
+                    self.written += 1
+                else:
+                    self.failed += 1
+                    self.failed_keys.append(item[0])
+
+    def _put(self, item: tuple[str, bytes, str | None, bool]) -> bool:
+        key, body, content_type, compress = item
+        try:
+            write_file_to_s3(
+                self.s3_client, self.bucket, key, body,
+                compress=compress, checksum_algorithm=self.checksum_algorithm,
+                content_type=content_type
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                "Batched write failed for s3://%s/%s: %s", self.bucket, key, e,
+                extra={'bucket': self.bucket, 'key': key}
+            )
+            return False
 
 
 @dataclass
 class S3WriterState:
-    """Global state management for the metaagent."""
+    """State for one S3FileWriter instance."""
     config: S3WriterConfig | None = None
     s3_client: Any = None
+    s3_uri_prefix: str = ""  # "s3://<bucket>/", built once in on_create
+    batch_writer: BatchWriter | None = None
 
     def reset(self) -> None:
         """Reset state to initial condition."""
         self.config = None
         self.s3_client = None
+        self.s3_uri_prefix = ""
+        self.batch_writer = None
 
 
-# Global state instance
-_state = S3WriterState()
+# Process-wide S3 clients keyed by credentials and region. Clients outlive
+# on_destroy so re-initialising keeps their warm connection pools.
+_client_cache: dict[tuple[str, str, str, bool], Any] = {}
+_client_cache_lock = threading.Lock()
 
 
 # --- Helper Functions ---
-def write_file_to_s3(s3_client: Any, bucket: str, key: str, content: str | bytes) -> dict[str, Any]:
+def _get_s3_client(config: S3WriterConfig) -> Any:
+    """Return the cached S3 client for these credentials, creating it on first use."""
+    cache_key = (config.aws_access_key_id, config.aws_secret_access_key, config.region_name, config.express)
+    with _client_cache_lock:
+        s3_client = _client_cache.get(cache_key)
+        if s3_client is None:
+            s3_client = boto3.client(
+                "s3",
+                aws_access_key_id=config.aws_access_key_id,
+                aws_secret_access_key=config.aws_secret_access_key,
+                region_name=config.region_name,
+                config=Config(**S3_CLIENT_CONFIG, **(S3_EXPRESS_CLIENT_CONFIG if config.express else {}))
+            )
+            _client_cache[cache_key] = s3_client
+        return s3_client
+
+
+@lru_cache(maxsize=256)
+def _key_prefix(location: str) -> tuple[str, str]:
     """
-    Write a file to S3.
+    Normalize a folder location into its cleaned form and S3 key prefix.
+
+    Writers usually target a handful of folders, so the result is cached
+    and repeated calls skip the strip/format work.
 
     Args:
-        s3_client: Boto3 S3 client instance
-        bucket: S3 bucket name
-        key: S3 object key (full path)
-        content: Content to write (string or bytes)
+        location: Folder path in the bucket, e.g. "/outputs/run1/"
 
     Returns:
-        Dictionary with write results including ETag and file size
-
-    Raises:
-        Exception: If file cannot be written to S3
+        Tuple of (cleaned location, key prefix with trailing slash)
     """
-    try:
-        # Convert string to bytes if needed
-        if isinstance(content, str):
-            content_bytes = content.encode('utf-8')
-        else:
-            content_bytes = content
-
-        # Write to S3
-        response = s3_client.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=content_bytes
-        )
-
-        logger.info(f"Successfully wrote to s3://{bucket}/{key}")
+    # Clean up location (remove surrounding whitespace and slashes)
+    location = location.strip().strip('/')
+    return location, location + '/'
 
-        return {
-            'etag': response.get('ETag', '').strip('"'),
-            'size': len(content_bytes),
-            'version_id': response.get('VersionId')
-        }
 
-    except Exception as e:
-        logger.error(f"Failed to write to s3://{bucket}/{key}: {e}")
-        raise
+def _to_json_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str dict keys or ints beyond 64 bits, which json accepts
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 
-# --- Metaagent Interface Functions ---
-def on_create(data: dict[str, Any]) -> dict[str, Any]:
+def _serialize_content(obj: Any, content_format: str) -> bytes:
     """
-    Initialize the metaagent with S3 writer configuration.
-
-    Expected data format:
-    {
-        "aws_access_key_id": "YOUR_ACCESS_KEY",
-        "aws_secret_access_key": "YOUR_SECRET_KEY",
-        "region_name": "us-east-1",  # optional, defaults to us-east-1
-        "bucket": "your-bucket-name"
-    }
+    Serialize dict/list content in the requested format.
 
     Args:
-        data: Configuration dictionary
+        obj: Object to serialize
+        content_format: One of CONTENT_FORMATS
 
     Returns:
-        Status dictionary with initialization results
-    """
-    global _state
-
-    # Extract S3 configuration parameters
-    aws_access_key_id = data.get('aws_access_key_id')
-    aws_secret_access_key = data.get('aws_secret_access_key')
-    region_name = data.get('region_name', 'us-east-1')
-    bucket = data.get('bucket', '')
-
-    if not aws_access_key_id or not aws_secret_access_key:
-        return {
-            'status': 'error',
-            'message': 'aws_access_key_id and aws_secret_access_key are required'
-        }
+        Serialized bytes
 
-    if not bucket:
-        return {
-            'status': 'error',
-            'message': 'bucket is required'
-        }
-
-    try:
-        import boto3
-
-        # Create S3WriterConfig
-        s3_config = S3WriterConfig(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name,
-            bucket=bucket
-        )
-
-        # Create S3 client
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=s3_config.aws_access_key_id,
-            aws_secret_access_key=s3_config.aws_secret_access_key,
-            region_name=s3_config.region_name
-        )
+    Raises:
+        ImportError: If the serializer for the format is not installed
+    """
+    if content_format == 'json':
+        return _to_json_bytes(obj)
+    if content_format == 'msgpack':
+        if msgpack is None:
+            raise ImportError("msgpack is required for content_format 'msgpack' (pip install msgpack)")
+        return msgpack.packb(obj, use_bin_type=True)
+    if cbor2 is None:
+        raise ImportError("cbor2 is required for content_format 'cbor' (pip install cbor2)")
+    return cbor2.dumps(obj)
+
+
+def _encode_content(content: Any, is_bytes: bool, content_format: str) -> tuple[Any, str | None]:
+    """
+    Serialize dict/list content; pass text and bytes-like content through.
 
-        _state.config = s3_config
-        _state.s3_client = s3_client
+    Returns:
+        Tuple of (content, Content-Type for serialized content or None)
+    """
+    if is_bytes or isinstance(content, (str, bytes, bytearray, memoryview)):
+        return content, None
+    # Assume it's a dict/list that needs serialization
+    return _serialize_content(content, content_format), CONTENT_FORMATS[content_format]
+
+
+def _prepare_upload(
+    key: str,
+    content: str | bytes | bytearray | memoryview,
+    compress: bool,
+    checksum_algorithm: str,
+    content_type: str | None
+) -> tuple[bytes | bytearray | memoryview, int, dict[str, str]]:
+    """
+    Encode and optionally gzip a payload, and build its upload arguments.
 
-        logger.info(f"S3 file writer metaagent initialized: bucket={bucket}")
+    Returns:
+        Tuple of (payload to upload, original size in bytes, put_object/ExtraArgs arguments)
+    """
+    # Convert string to bytes if needed
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    size = len(content) if not isinstance(content, memoryview) else content.nbytes
+    extra_args = {'ContentType': content_type} if content_type else {}
+    if compress and size >= GZIP_MIN_BYTES:
+        content = gzip.compress(content, compresslevel=GZIP_COMPRESS_LEVEL)
+        extra_args['ContentEncoding'] = 'gzip'
+        if not content_type:
+            extra_args['ContentType'] = mimetypes.guess_type(key)[0] or 'application/octet-stream'
+
+    if checksum_algorithm:
+        extra_args['ChecksumAlgorithm'] = checksum_algorithm
+
+    return content, size, extra_args
+
+
+def _crc32c_b64(content: bytes | bytearray | memoryview) -> str:
+    """Base64 CRC32C of content in the form S3 expects for ChecksumCRC32C."""
+    crc = google_crc32c.value(content)
+    return base64.b64encode(crc.to_bytes(4, 'big')).decode('ascii')
+
+
+def _write_result(
+    response: dict[str, Any],
+    size: int,
+    stored_size: int,
+    extra_args: dict[str, str],
+    checksum_algorithm: str
+) -> dict[str, Any]:
+    """Build the write result returned by write_file_to_s3 from an S3 response."""
+    # S3 always quotes the ETag, so slicing beats a character-set strip
+    etag = response.get('ETag')
+    if etag and etag[0] == '"':
+        etag = etag[1:-1]
+
+    return {
+        'etag': etag or '',
+        'size': size,
+        'stored_size': stored_size,
+        'content_encoding': extra_args.get('ContentEncoding'),
+        'checksum': response.get(f'Checksum{checksum_algorithm}') if checksum_algorithm else None,
+        'version_id': response.get('VersionId')
+    }
 
-        return {
-            'status': 'initialized',
-            'region': region_name,
-            'bucket': bucket
-        }
 
-    except Exception as e:
-        logger.error(f"Failed to initialize S3 writer client: {e}")
-        return {
-            'status': 'error',
-            'message': str(e)
-        }
+def write_file_to_s3(
+    s3_client: Any,
+    bucket: str,
+    key: str,
+    content: str | bytes | bytearray | memoryview,
+    compress: bool = False,
+    checksum_algorithm: str = "",
+    content_type: str | None = None
+) -> dict[str, Any]:
+    """
+    Write a file to S3.
 
+    The payload is wrapped once in a BytesIO that both upload paths stream
+    from; for bytes this shares the existing buffer rather than copying it.
+    Payloads below the multipart threshold are sent with a single put_object.
+    Larger payloads go through upload_fileobj, which uploads parts in parallel
+    over several connections; a HEAD afterwards recovers the ETag and version.
 
-def on_receive(data: dict[str, Any]) -> dict[str, Any]:
-    """
-    Write content to S3 with the specified location and filename.
+    With compress=True, payloads of at least GZIP_MIN_BYTES are gzipped and
+    stored with Content-Encoding: gzip and a Content-Type guessed from the key,
+    so HTTP clients that honour the header decompress transparently.
 
-    Expected data format:
-    {
-        "content": "content to write",  # string or will be JSON serialized
-        "location": "path/to/folder",  # folder path in bucket
-        "filename": "file.json"  # filename with extension
-    }
+    With a checksum_algorithm (CRC32, CRC32C, SHA1 or SHA256), S3 verifies the
+    upload against that checksum and stores it with the object. For
+    single-request CRC32C uploads the value is precomputed with google-crc32c
+    when installed; otherwise, and for multipart uploads, botocore computes
+    it, which for CRC32C requires awscrt (on_create checks this).
 
     Args:
-        data: Data dictionary with content, location, and filename
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        key: S3 object key (full path)
+        content: Content to write (string, or any bytes-like object)
+        compress: Gzip the payload before upload
+        checksum_algorithm: Additional S3 checksum algorithm, or "" for none
+        content_type: Content-Type to store, or None to leave it unset
+            (compressed writes then guess it from the key)
 
     Returns:
-        Results dictionary with write confirmation
+        Dictionary with write results including ETag, file size, the number
+        of bytes stored, the content encoding (None when uncompressed) and
+        the base64 checksum S3 recorded (None when no algorithm was requested)
 
     Raises:
-        RuntimeError: If metaagent not initialized or write fails
+        Exception: If file cannot be written to S3
     """
-    global _state
+    try:
+        content, size, extra_args = _prepare_upload(key, content, compress, checksum_algorithm, content_type)
 
-    if _state.s3_client is None or _state.config is None:
-        return {
-            'status': 'error',
-            'message': 'S3 file writer metaagent not initialized. Call on_create() first.'
-        }
+        body = BytesIO(content)
+        stored_size = body.seek(0, 2)
+        body.seek(0)
 
-    # Extract required parameters
-    content = data.get('content')
-    location = data.get('location', '').strip()
-    filename = data.get('filename', '').strip()
+        # Write to S3
+        if stored_size < S3_TRANSFER_CONFIG['multipart_threshold']:
+            if checksum_algorithm == 'CRC32C' and google_crc32c is not None:
+                extra_args['ChecksumCRC32C'] = _crc32c_b64(content)
+            response = s3_client.put_object(
+                Bucket=bucket,
+                Key=key,
+                Body=body,
+                **extra_args
+            )
+        else:
+            s3_client.upload_fileobj(
+                body,
+                bucket,
+                key,
+                ExtraArgs=extra_args or None,
+                Config=_TRANSFER_CONFIG
+            )
+            # ChecksumMode makes S3 return the stored checksum
+            head_args = {'ChecksumMode': 'ENABLED'} if checksum_algorithm else {}
+            response = s3_client.head_object(Bucket=bucket, Key=key, **head_args)
 
-    if content is None:
-        return {
-            'status': 'error',
-            'message': 'content is required'
-        }
+        logger.info("Successfully wrote to s3://%s/%s", bucket, key, extra={'bucket': bucket, 'key': key})
 
-    if not location:
-        return {
-            'status': 'error',
-            'message': 'location is required'
-        }
+        return _write_result(response, size, stored_size, extra_args, checksum_algorithm)
 
-    if not filename:
-        return {
-            'status': 'error',
-            'message': 'filename is required'
-        }
+    except Exception as e:
+        logger.error("Failed to write to s3://%s/%s: %s", bucket, key, e, extra={'bucket': bucket, 'key': key})
+        raise
 
-    # Get bucket from config
-    bucket = _state.config.bucket
 
-    try:
-        # Build full S3 key from location and filename
-        # Clean up location (remove leading/trailing slashes)
-        location = location.strip('/')
-        # Always include location in path since it's required
-        full_key = f"{location}/{filename}"
+def write_files_to_s3(
+    s3_client: Any,
+    bucket: str,
+    files: list[tuple[str, Any, str | None]],
+    compress: bool = False,
+    checksum_algorithm: str = "",
+    max_workers: int = 10
+) -> list[dict[str, Any]]:
+    """
+    Write many files to S3 concurrently over one shared client.
 
-        # Convert content to string if it's not already
-        if not isinstance(content, (str, bytes)):
-            # Assume it's a dict/list that needs JSON serialization
-            content = json.dumps(content, indent=2)
+    Args:
+        s3_client: Boto3 S3 client instance (thread-safe)
+        bucket: S3 bucket name
+        files: List of (key, content, content_type) tuples
+        compress: Gzip payloads before upload
+        checksum_algorithm: Additional S3 checksum algorithm, or "" for none
+        max_workers: Maximum number of concurrent uploads
 
-        # Write to S3
-        write_result = write_file_to_s3(_state.s3_client, bucket, full_key, content)
-
-        return {
-            'status': 'success',
-            'bucket': bucket,
-            'location': location,
-            'filename': filename,
-            'key': full_key,
-            'size': write_result['size'],
-            'etag': write_result['etag'],
-            'version_id': write_result.get('version_id'),
-            's3_path': f"s3://{bucket}/{full_key}"
-        }
+    Returns:
+        Write results, in the order of files
 
-    except Exception as e:
-        logger.error(f"Write operation failed: {e}", exc_info=True)
-        return {
-            'status': 'error',
-            'message': str(e)
-        }
+    Raises:
+        Exception: If any file cannot be written to S3
+    """
+    def write(item: tuple[str, Any, str | None]) -> dict[str, Any]:
+        key, content, content_type = item
+        return write_file_to_s3(
+            s3_client, bucket, key, content,
+            compress=compress, checksum_algorithm=checksum_algorithm, content_type=content_type
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files)) or 1) as executor:
+        return list(executor.map(write, files))
 
 
-def on_destroy(data: dict[str, Any] | None = None) -> dict[str, Any]:
+async def _write_files_async(
+    config: S3WriterConfig,
+    bucket: str,
+    files: list[tuple[str, Any, str | None]],
+    max_concurrency: int = 32
+) -> list[dict[str, Any]]:
     """
-    Clean up metaagent resources.
+    Write many files to S3 on a single event loop using aioboto3.
+
+    Requires the optional aioboto3 package. A single event loop keeps many
+    PUTs in flight without one thread per request. Every file goes through
+    a single put_object, so this suits small and medium payloads.
 
     Args:
-        data: Optional data dictionary (unused)
+        config: Writer configuration with credentials, region and write options
+        bucket: S3 bucket name
+        files: List of (key, content, content_type) tuples
+        max_concurrency: Maximum number of in-flight requests
 
     Returns:
-        Status dictionary
+        Write results, in the order of files
+    """
+    import aioboto3
+
+    session = aioboto3.Session(
+        aws_access_key_id=config.aws_access_key_id,
+        aws_secret_access_key=config.aws_secret_access_key,
+        region_name=config.region_name
+    )
+    client_config = Config(**{**S3_CLIENT_CONFIG, "max_pool_connections": max_concurrency})
+    semaphore = asyncio.Semaphore(max_concurrency)
+    checksum_algorithm = config.checksum_algorithm
+
+    async with session.client("s3", config=client_config) as s3_client:
+        async def write(key: str, content: Any, content_type: str | None) -> dict[str, Any]:
+            payload, size, extra_args = _prepare_upload(
+                key, content, config.compress, checksum_algorithm, content_type
+            )
+            if isinstance(payload, memoryview):
+                payload = payload.tobytes()
+            if checksum_algorithm == 'CRC32C' and google_crc32c is not None:
+                extra_args['ChecksumCRC32C'] = _crc32c_b64(payload)
+            async with semaphore:
+                response = await s3_client.put_object(Bucket=bucket, Key=key, Body=payload, **extra_args)
+            return _write_result(response, size, len(payload), extra_args, checksum_algorithm)
+
+        return await asyncio.gather(*(write(*item) for item in files))
+
+
+# --- Writer ---
+class S3FileWriter:
+    """
+    An S3 writer bound to one configuration.
+
+    Each instance owns its own S3WriterState, so several buckets or
+    credential sets can be served from one process, and on_receive may be
+    called from many threads at once - it only reads state, and boto3
+    clients are thread-safe. The module-level metaagent functions delegate
+    to a default instance.
     """
-    global _state
 
-    if _state.config is None:
-        return {'status': 'already_destroyed'}
+    def __init__(self) -> None:
+        self.state = S3WriterState()
+
+    def on_create(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Initialize the metaagent with S3 writer configuration.
+
+        Expected data format:
+        {
+            "aws_access_key_id": "YOUR_ACCESS_KEY",
+            "aws_secret_access_key": "YOUR_SECRET_KEY",
+            "region_name": "us-east-1",  # optional, defaults to us-east-1
+            "bucket": "your-bucket-name",
+            "batch_size": 0,  # optional, > 0 enables background batched writes
+            "batch_flush_ms": 50,  # optional, max wait before a partial batch is sent
+            "batch_max_pending": 0,  # optional, queued writes before on_receive blocks (0 = 4 x batch_size)
+            "max_concurrency": 10,  # optional, parallel PUTs per batch
+            "compress": false,  # optional, gzip payloads with Content-Encoding: gzip
+            "checksum_algorithm": "CRC32C",  # optional, additional S3 integrity checksum
+            "content_format": "json",  # optional, json | msgpack | cbor for dict/list content
+            "express": false  # optional, bucket is an S3 Express One Zone directory bucket
+        }
 
-    # Reset state
-    _state.reset()
-    logger.info("S3 file writer metaagent destroyed")
+        Args:
+            data: Configuration dictionary
+
+        Returns:
+            Status dictionary with initialization results
+        """
+        state = self.state
+
+        # Extract S3 configuration parameters
+        aws_access_key_id = data.get('aws_access_key_id')
+        aws_secret_access_key = data.get('aws_secret_access_key')
+        region_name = data.get('region_name', 'us-east-1')
+        bucket = data.get('bucket', '')
+
+        if not aws_access_key_id or not aws_secret_access_key:
+            return {
+                'status': 'error',
+                'message': 'aws_access_key_id and aws_secret_access_key are required'
+            }
+
+        if not bucket:
+            return {
+                'status': 'error',
+                'message': 'bucket is required'
+            }
+
+        if not _BOTO3_AVAILABLE:
+            return {
+                'status': 'error',
+                'message': 'boto3 is required for the S3 file writer metaagent (pip install boto3)'
+            }
+
+        express = bool(data.get('express', False))
+        if express and not _EXPRESS_BUCKET_RE.match(bucket):
+            return {
+                'status': 'error',
+                'message': f"express requires a directory bucket name like 'name--usw2-az1--x-s3', got: {bucket}"
+            }
+
+        if data.get('content_format', 'json') not in CONTENT_FORMATS:
+            return {
+                'status': 'error',
+                'message': f"Unknown content_format: {data.get('content_format')}. "
+                           f"Supported: {', '.join(CONTENT_FORMATS)}"
+            }
+
+        checksum_algorithm = str(data.get('checksum_algorithm') or '').upper()
+        if checksum_algorithm and checksum_algorithm not in CHECKSUM_ALGORITHMS:
+            return {
+                'status': 'error',
+                'message': f"Unknown checksum_algorithm: {data.get('checksum_algorithm')}. "
+                           f"Supported: {', '.join(CHECKSUM_ALGORITHMS)}"
+            }
+        if checksum_algorithm == 'CRC32C' and not _AWSCRT_AVAILABLE:
+            return {
+                'status': 'error',
+                'message': "checksum_algorithm CRC32C requires awscrt (pip install botocore[crt]); "
+                           "use CRC32 otherwise"
+            }
+
+        try:
+            # Create S3WriterConfig
+            s3_config = S3WriterConfig(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name,
+                bucket=bucket,
+                batch_size=int(data.get('batch_size', 0)),
+                batch_flush_ms=int(data.get('batch_flush_ms', 50)),
+                batch_max_pending=int(data.get('batch_max_pending', 0)),
+                max_concurrency=int(data.get('max_concurrency', 10)),
+                compress=bool(data.get('compress', False)),
+                checksum_algorithm=checksum_algorithm,
+                content_format=data.get('content_format', 'json'),
+                express=express
+            )
+
+            # Reuse the process-wide S3 client for these credentials
+            s3_client = _get_s3_client(s3_config)
+
+            state.config = s3_config
+            state.s3_client = s3_client
+            state.s3_uri_prefix = f"s3://{bucket}/"
+
+            # Flush any writer left over from a previous on_create
+            if state.batch_writer is not None:
+                state.batch_writer.close()
+                state.batch_writer = None
+
+            if s3_config.batch_size > 0:
+                state.batch_writer = BatchWriter(
+                    s3_client=s3_client,
+                    bucket=bucket,
+                    batch_size=s3_config.batch_size,
+                    flush_interval=s3_config.batch_flush_ms / 1000,
+                    max_concurrency=s3_config.max_concurrency,
+                    compress=s3_config.compress,
+                    checksum_algorithm=s3_config.checksum_algorithm,
+                    max_pending=s3_config.batch_max_pending or 4 * s3_config.batch_size
+                )
+                state.batch_writer.start()
+
+            logger.info("S3 file writer metaagent initialized: bucket=%s", bucket)
+
+            return {
+                'status': 'initialized',
+                'region': region_name,
+                'bucket': bucket,
+                'express': express
+            }
+
+        except Exception as e:
+            logger.error("Failed to initialize S3 writer client: %s", e)
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+
+    def on_receive(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Write content to S3 with the specified location and filename.
+
+        Expected data format:
+        {
+            "content": "content to write",  # string/bytes, or dict/list to be JSON serialized
+            "content_bytes": b"...",  # alternative to content: pre-encoded bytes, written as-is
+            "location": "path/to/folder",  # folder path in bucket
+            "filename": "file.json",  # filename with extension
+            "compress": true,  # optional, overrides the on_create setting
+            "content_format": "msgpack"  # optional, overrides the on_create setting
+        }
 
-    return {'status': 'destroyed'}
+        To write several files concurrently in one call, pass a list instead:
+        {
+            "files": [
+                {"content": {...}, "location": "path/to/folder", "filename": "a.json"},
+                ...
+            ],
+            "max_workers": 10,  # optional, concurrent uploads
+            "use_async": false  # optional, upload on an asyncio event loop (requires aioboto3)
+        }
+
+        Args:
+            data: Data dictionary with content, location, and filename
+
+        Returns:
+            Results dictionary with write confirmation
+
+        Raises:
+            RuntimeError: If metaagent not initialized or write fails
+        """
+        state = self.state
+
+        config = state.config
+        if state.s3_client is None or config is None:
+            return {
+                'status': 'error',
+                'message': 'S3 file writer metaagent not initialized. Call on_create() first.'
+            }
+
+        if data.get('files') is not None:
+            return self._receive_files(data)
+
+        # Extract required parameters - pre-encoded content_bytes skips type dispatch
+        content_bytes = data.get('content_bytes')
+        content = data.get('content') if content_bytes is None else content_bytes
+        location = data.get('location', '')
+        filename = data.get('filename', '').strip()
+
+        if content is None:
+            return {
+                'status': 'error',
+                'message': 'content is required'
+            }
+
+        if content_bytes is not None and not isinstance(content_bytes, (bytes, bytearray, memoryview)):
+            return {
+                'status': 'error',
+                'message': 'content_bytes must be bytes, bytearray or memoryview'
+            }
+
+        if not location or location.isspace():
+            return {
+                'status': 'error',
+                'message': 'location is required'
+            }
+
+        if not filename:
+            return {
+                'status': 'error',
+                'message': 'filename is required'
+            }
+
+        content_format = data.get('content_format', config.content_format)
+        if content_format not in CONTENT_FORMATS:
+            return {
+                'status': 'error',
+                'message': f"Unknown content_format: {content_format}. "
+                           f"Supported: {', '.join(CONTENT_FORMATS)}"
+            }
+
+        # Get bucket from config
+        bucket = config.bucket
+
+        try:
+            # Build full S3 key from the cached location prefix and filename
+            # Always include location in path since it's required
+            location, key_prefix = _key_prefix(location)
+            full_key = key_prefix + filename
+
+            # Convert content to bytes if it's not already text or bytes-like
+            content, content_type = _encode_content(content, content_bytes is not None, content_format)
+            compress = data.get('compress', config.compress)
+
+            if state.batch_writer is not None:
+                # Hand off to the background flusher; copy so later caller mutations can't leak in
+                body = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+                state.batch_writer.submit(full_key, body, content_type, compress)
+                return {
+                    'status': 'queued',
+                    'bucket': bucket,
+                    'location': location,
+                    'filename': filename,
+                    'key': full_key,
+                    'size': len(body),
+                    's3_path': state.s3_uri_prefix + full_key
+                }
+
+            # Write to S3
+            write_result = write_file_to_s3(
+                state.s3_client, bucket, full_key, content,
+                compress=compress, checksum_algorithm=config.checksum_algorithm,
+                content_type=content_type
+            )
+
+            return {
+                'status': 'success',
+                'bucket': bucket,
+                'location': location,
+                'filename': filename,
+                'key': full_key,
+                'size': write_result['size'],
+                'stored_size': write_result['stored_size'],
+                'content_encoding': write_result['content_encoding'],
+                'checksum': write_result['checksum'],
+                'etag': write_result['etag'],
+                'version_id': write_result.get('version_id'),
+                's3_path': state.s3_uri_prefix + full_key
+            }
+
+        except Exception as e:
+            logger.error("Write operation failed: %s", e, exc_info=True)
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+
+    def _receive_files(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Write the entries of data["files"] concurrently. See on_receive."""
+        state = self.state
+        config = state.config
+
+        files = data['files']
+        if not files:
+            return {
+                'status': 'error',
+                'message': 'files must be a non-empty list'
+            }
+
+        content_format = data.get('content_format', config.content_format)
+        if content_format not in CONTENT_FORMATS:
+            return {
+                'status': 'error',
+                'message': f"Unknown content_format: {content_format}. "
+                           f"Supported: {', '.join(CONTENT_FORMATS)}"
+            }
+
+        bucket = config.bucket
+        compress = data.get('compress', config.compress)
+
+        try:
+            prepared = []
+            for entry in files:
+                content_bytes = entry.get('content_bytes')
+                content = entry.get('content') if content_bytes is None else content_bytes
+                location = entry.get('location', '')
+                filename = entry.get('filename', '').strip()
+                if content is None or not location or location.isspace() or not filename:
+                    return {
+                        'status': 'error',
+                        'message': 'each entry in files requires content, location and filename'
+                    }
+
+                _, key_prefix = _key_prefix(location)
+                content, content_type = _encode_content(content, content_bytes is not None, content_format)
+                prepared.append((key_prefix + filename, content, content_type))
+
+            if data.get('use_async', False):
+                results = asyncio.run(_write_files_async(
+                    replace(config, compress=compress), bucket, prepared, data.get('max_workers', 32)
+                ))
+            else:
+                results = write_files_to_s3(
+                    state.s3_client, bucket, prepared,
+                    compress=compress, checksum_algorithm=config.checksum_algorithm,
+                    max_workers=data.get('max_workers', config.max_concurrency)
+                )
+
+            return {
+                'status': 'success',
+                'bucket': bucket,
+                'files': [
+                    {'key': key, 's3_path': state.s3_uri_prefix + key, **result}
+                    for (key, _, _), result in zip(prepared, results)
+                ],
+                'count': len(results)
+            }
+
+        except Exception as e:
+            logger.error("Multi-file write failed: %s", e, exc_info=True)
+            return {
+                'status': 'error',
+                'message': str(e)
+            }
+
+    def on_destroy(self, data: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Clean up metaagent resources.
+
+        When batching is enabled, queued writes are flushed before returning.
+
+        Args:
+            data: Optional data dictionary (unused)
+
+        Returns:
+            Status dictionary
+        """
+        state = self.state
+
+        if state.config is None:
+            return {'status': 'already_destroyed'}
+
+        result = {'status': 'destroyed'}
+        if state.batch_writer is not None:
+            result.update(state.batch_writer.close())
+
+        # Reset state - the cached S3 client is kept for the next on_create
+        state.reset()
+        logger.info("S3 file writer metaagent destroyed")
+
+        return result
+
+
+# --- Metaagent Interface Functions ---
+# Default writer used by the module-level metaagent API. The entry points
+# are its bound methods rather than wrapper functions, so each call goes
+# straight to the writer without an extra Python frame. See S3FileWriter
+# for the data formats.
+_writer = S3FileWriter()
+_state = _writer.state
+
+on_create = _writer.on_create
+on_receive = _writer.on_receive
+on_destroy = _writer.on_destroy
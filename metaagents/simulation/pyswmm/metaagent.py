@@ -25,27 +25,43 @@ from __future__ import annotations
 
 # --- dataclass runtime guard (fixes NoneType __dict__ crash) ---
 import sys, types
-if not isinstance(__name__, str) or __name__ not in sys.modules:
-    module_name = "xmtwin_runtime"  # any stable name is fine
+_loaded_by_guard = not isinstance(__name__, str) or __name__ not in sys.modules
+if _loaded_by_guard:
+    module_name = "xmtwin_runtime_pyswmm"  # any stable name unique to this file is fine
     globals()["__name__"] = module_name
+    # Register a module that resolves names from these globals, so functions
+    # defined below can be pickled by reference for worker processes
+    _guard_globals = globals()
+
+    def _guard_getattr(name):
+        try:
+            return _guard_globals[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
     mod = types.ModuleType(module_name)
-    mod.__dict__.update(globals())
+    mod.__getattr__ = _guard_getattr
     sys.modules[module_name] = mod
 # --- end guard ---
 
 import gc
 import gzip
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import shutil
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryDirectory, mkdtemp
-from typing import Any, Protocol
+from tempfile import gettempdir, mkdtemp
+from typing import Any, BinaryIO, Protocol
 from urllib.parse import urlparse
 
 try:
@@ -55,7 +71,18 @@ except ImportError:
     class StrEnum(str, Enum):  # polyfill
         pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from pyswmm import Simulation, SimulationPreConfig, Output
+from swmm.toolkit import output as swmm_output
 from swmm.toolkit.shared_enum import (
     SubcatchAttribute as SA,
     NodeAttribute as NA,
@@ -76,6 +103,25 @@ class SourceType(StrEnum):
     HTTP = "http"
 
 
+class ExportReadOrder(StrEnum):
+    """How the JSON export reads results from the .out file."""
+    SERIES = "series"  # one whole time series per (entity, attribute)
+    PERIOD = "period"  # one all-entity slab per (period, attribute), scanning the file in order
+    AUTO = "auto"  # period order per group when it has several entities and fits PERIOD_READ_MAX_VALUES
+
+
+class ExportCompression(StrEnum):
+    """Compression of the JSON export files."""
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+class ExportLayout(StrEnum):
+    """Shape of each series in the JSON export."""
+    PAIRS = "pairs"  # attr: [[timestamp, value], ...]
+    COLUMNAR = "columnar"  # timestamps once in meta.t; attr: [value, ...]
+
+
 class SWMMSection(StrEnum):
     """SWMM input file sections that can be modified."""
     OPTIONS = "OPTIONS"
@@ -89,6 +135,12 @@ S3_JSON_EXTRA_ARGS = {
     "CacheControl": "public, max-age=31536000, immutable"
 }
 
+S3_JSON_ZSTD_EXTRA_ARGS = {
+    "ContentType": "application/json",
+    "ContentEncoding": "zstd",
+    "CacheControl": "public, max-age=31536000, immutable"
+}
+
 S3_MANIFEST_EXTRA_ARGS = {
     "ContentType": "application/json",
     "CacheControl": "public, max-age=300"
@@ -110,12 +162,71 @@ S3_RPT_FILE_EXTRA_ARGS = {
     "CacheControl": "public, max-age=31536000, immutable"
 }
 
+# Multipart upload settings (boto3 TransferConfig) - large .out files are sent
+# as 16 MB parts over several connections
+S3_TRANSFER_CONFIG = {
+    "multipart_threshold": 16 * 1024 * 1024,
+    "multipart_chunksize": 16 * 1024 * 1024,
+    "max_concurrency": 10,
+    "io_chunksize": 1024 * 1024,
+    "use_threads": True
+}
+
+# Number of files uploaded concurrently
+S3_UPLOAD_WORKERS = 8
+
+# gzip level for simulation files compressed before upload (compress_simulation_files)
+SIMULATION_FILE_GZIP_LEVEL = 1
+
+# Buffer size for streaming HTTP downloads to disk
+HTTP_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Write buffer for TIMESERIES data files
+TIMESERIES_WRITE_BUFFER = 1024 * 1024
+
+# Remote network files are cached here, keyed by source and ETag/Last-Modified
+DOWNLOAD_CACHE_DIR = Path(gettempdir()) / "swmm_download_cache"
+
+# Size budget of the download cache; least recently used entries are evicted beyond it
+DOWNLOAD_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
 # Attributes to export for each entity type
 SYSTEM_ATTRS = [SYSA.RAINFALL, SYSA.RUNOFF_FLOW, SYSA.OUTFALL_FLOWS, SYSA.SNOW_DEPTH]
 SUBCATCH_ATTRS = [SA.RAINFALL, SA.RUNOFF_RATE, SA.SNOW_DEPTH, SA.EVAP_LOSS, SA.INFIL_LOSS, SA.SOIL_MOISTURE]
 NODE_ATTRS = [NA.INVERT_DEPTH, NA.HYDRAULIC_HEAD, NA.TOTAL_INFLOW, NA.LATERAL_INFLOW, NA.FLOODING_LOSSES]
 LINK_ATTRS = [LA.FLOW_RATE, LA.FLOW_DEPTH, LA.FLOW_VELOCITY, LA.FLOW_VOLUME]
 
+# gzip level for the JSON exports. Level 1 is several times faster than the
+# default 9 and only modestly larger on repetitive numeric JSON.
+EXPORT_GZIP_LEVEL = 1
+
+# zstd level for the JSON exports (export_compression="zstd"). Level 3 both
+# compresses faster than gzip level 1 and produces smaller files.
+EXPORT_ZSTD_LEVEL = 3
+
+# Largest group (entities x attributes x periods) the automatic read order will
+# read period-major; period-major reads hold the whole group in memory, at
+# roughly 40 bytes per value as Python floats in tuples.
+PERIOD_READ_MAX_VALUES = 5_000_000
+
+# File suffix and S3 upload settings of each export compression
+EXPORT_FILE_SUFFIXES = {
+    ExportCompression.GZIP: ".json.gz",
+    ExportCompression.ZSTD: ".json.zst",
+}
+EXPORT_EXTRA_ARGS = {
+    ExportCompression.GZIP: S3_JSON_EXTRA_ARGS,
+    ExportCompression.ZSTD: S3_JSON_ZSTD_EXTRA_ARGS,
+}
+
+# Export groups: name -> attributes; each is written to <name>.json.gz (or .json.zst)
+EXPORT_GROUPS = {
+    "system": SYSTEM_ATTRS,
+    "subcatchments": SUBCATCH_ATTRS,
+    "nodes": NODE_ATTRS,
+    "links": LINK_ATTRS,
+}
+
 
 # --- Data Classes ---
 @dataclass
@@ -131,6 +242,27 @@ class NetworkConfig:
         if isinstance(self.source_type, str):
             self.source_type = SourceType(self.source_type.lower())
 
+    @property
+    def mod_out(self) -> Path:
+        """Binary results of the modified network (<name>_mod.out)."""
+        return _modified_path(self.network_file_local, ".out")
+
+    @property
+    def mod_inp(self) -> Path:
+        """Modified input file written by the preconfig (<name>_mod.inp)."""
+        return _modified_path(self.network_file_local, ".inp")
+
+    @property
+    def mod_rpt(self) -> Path:
+        """Report of the modified network (<name>_mod.rpt)."""
+        return _modified_path(self.network_file_local, ".rpt")
+
+
+def _modified_path(network_file_local: str, suffix: str) -> Path:
+    """Return the path of a file SWMM writes next to the network for the modified run."""
+    path = Path(network_file_local)
+    return path.with_name(f"{path.stem}_mod{suffix}")
+
 
 @dataclass
 class S3Config:
@@ -148,12 +280,28 @@ class SimulationState:
     config: NetworkConfig | None = None
     s3_config: S3Config | None = None
     s3_client: Any = None  # boto3 client
+    transfer_config: Any = None  # boto3 TransferConfig shared by all uploads
+    compress_simulation_files: bool = False  # gzip .out/.inp/.rpt before upload
+    export_read_order: ExportReadOrder = ExportReadOrder.AUTO
+    export_compression: ExportCompression = ExportCompression.GZIP
+    export_in_memory: bool = False  # compress serial exports into memory and upload without a temp file
+    export_layout: ExportLayout = ExportLayout.PAIRS
+    work_dir: Path | None = None  # long-lived scratch directory; each run gets a subdirectory
+    export_workers: int = 1  # processes for the JSON export; 1 exports serially in-process
 
     def reset(self) -> None:
         """Reset state to initial condition."""
         self.config = None
         self.s3_config = None
         self.s3_client = None
+        self.transfer_config = None
+        self.compress_simulation_files = False
+        self.export_read_order = ExportReadOrder.AUTO
+        self.export_compression = ExportCompression.GZIP
+        self.export_in_memory = False
+        self.export_layout = ExportLayout.PAIRS
+        self.work_dir = None
+        self.export_workers = 1
 
 
 # Global state instance
@@ -168,25 +316,60 @@ class FileDownloader(Protocol):
         """Download file from source to destination directory."""
         ...
 
+    def version(self, source: str) -> str | None:
+        """Return a remote version tag (ETag or Last-Modified) of source, or None if unknown."""
+        ...
+
 
 class S3Downloader:
     """Download files from AWS S3."""
 
+    # Default-credential client shared by all instances, created on first use
+    _default_client: Any = None
+
+    def __init__(self, client: Any = None):
+        self._client = client
+
+    def _get_client(self) -> Any:
+        """Return the explicit client, the configured metaagent client, or the shared default."""
+        if self._client is not None:
+            return self._client
+        if _state.s3_client is not None:
+            return _state.s3_client
+        if S3Downloader._default_client is None:
+            import boto3
+            S3Downloader._default_client = boto3.session.Session().client('s3')
+        return S3Downloader._default_client
+
+    @staticmethod
+    def _split_s3_path(s3_path: str) -> tuple[str, str]:
+        """Parse s3://bucket/key into (bucket, key)."""
+        bucket, key = s3_path[5:].split('/', 1)
+        return bucket, key
+
+    def version(self, s3_path: str) -> str | None:
+        """Return the object's ETag, or None if it cannot be read."""
+        bucket, key = self._split_s3_path(s3_path)
+        try:
+            return self._get_client().head_object(Bucket=bucket, Key=key).get('ETag')
+        except Exception as e:
+            logger.debug(f"HEAD s3://{bucket}/{key} failed: {e}")
+            return None
+
     def download(self, s3_path: str, dest_dir: str) -> str:
         """Download file from S3 to local directory."""
-        import boto3
+        from boto3.s3.transfer import TransferConfig
         from botocore.exceptions import ClientError
 
-        # Parse s3://bucket/key
-        parts = s3_path[5:].split('/', 1)
-        bucket, key = parts[0], parts[1]
+        bucket, key = self._split_s3_path(s3_path)
         filename = Path(key).name
         dest_path = Path(dest_dir) / filename
 
         try:
-            s3_client = boto3.client('s3')
+            s3_client = self._get_client()
+            transfer_config = _state.transfer_config or TransferConfig(**S3_TRANSFER_CONFIG)
             logger.info(f"Downloading s3://{bucket}/{key} to {dest_path}")
-            s3_client.download_file(bucket, key, str(dest_path))
+            s3_client.download_file(bucket, key, str(dest_path), Config=transfer_config)
             return str(dest_path)
         except ClientError as e:
             logger.error(f"Failed to download from S3: {e}")
@@ -203,6 +386,18 @@ class HTTPDownloader:
             return url.replace('github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
         return url
 
+    def version(self, url: str) -> str | None:
+        """Return the URL's ETag or Last-Modified header, or None if the server sends neither."""
+        import requests
+
+        try:
+            response = requests.head(self._normalize_url(url), allow_redirects=True, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"HEAD {url} failed: {e}")
+            return None
+        return response.headers.get('ETag') or response.headers.get('Last-Modified')
+
     def download(self, url: str, dest_dir: str) -> str:
         """Download file from HTTP/HTTPS URL."""
         import requests
@@ -214,9 +409,12 @@ class HTTPDownloader:
         logger.info(f"Downloading {url} to {dest_path}")
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            dest_path.write_bytes(response.content)
+            # Stream to disk so large .inp files never sit fully in memory
+            with requests.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(dest_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=HTTP_DOWNLOAD_CHUNK_SIZE)
             return str(dest_path)
         except requests.RequestException as e:
             logger.error(f"Failed to download from {url}: {e}")
@@ -261,11 +459,84 @@ class FileSourceManager:
         # Create temp directory if needed and download file
         download_dir = temp_dir or mkdtemp(prefix='swmm_')
         downloader = cls._downloaders.get(source_type)
-        return downloader.download(network_file, download_dir)
+
+        # SWMM writes its outputs next to the network file, so runs get a copy
+        # of the cached file rather than the cache entry itself
+        cached = cls._cached_download(downloader, network_file)
+        if cached is None:
+            return downloader.download(network_file, download_dir)
+        return str(shutil.copy2(cached, Path(download_dir) / cached.name))
+
+    @classmethod
+    def _cached_download(cls, downloader: FileDownloader, source: str) -> Path | None:
+        """
+        Return the cached copy of source for its current remote version, downloading it on a miss.
+
+        Args:
+            downloader: Downloader for the source type
+            source: Remote path or URL
+
+        Returns:
+            Path of the cached file, or None when the remote version is unknown
+
+        Raises:
+            RuntimeError: If downloading the file into the cache fails
+        """
+        version = downloader.version(source)
+        if not version:
+            return None
+
+        entry = DOWNLOAD_CACHE_DIR / hashlib.sha1(f"{source}\n{version}".encode('utf-8')).hexdigest()
+        if entry.is_dir():
+            logger.info(f"Using cached copy of {source} ({version})")
+            os.utime(entry)  # mark as recently used for eviction
+        else:
+            # Download into a staging directory and publish it with an atomic rename
+            DOWNLOAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            staging = Path(mkdtemp(prefix='.partial_', dir=DOWNLOAD_CACHE_DIR))
+            if downloader.download(source, str(staging)) is None:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise RuntimeError(f"Failed to download {source}")
+            try:
+                staging.rename(entry)
+            except OSError:
+                # Another process cached the same version first
+                shutil.rmtree(staging, ignore_errors=True)
+            cls._evict_cached_downloads(keep=entry)
+
+        return next(entry.iterdir(), None)
+
+    @staticmethod
+    def _evict_cached_downloads(keep: Path) -> None:
+        """Remove the least recently used cache entries until the cache fits DOWNLOAD_CACHE_MAX_BYTES."""
+        entries = []
+        total = 0
+        for entry in DOWNLOAD_CACHE_DIR.iterdir():
+            if entry.name.startswith('.'):
+                continue  # downloads still being staged
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                used = entry.stat().st_mtime
+            except OSError:
+                continue  # removed concurrently
+            total += size
+            if entry != keep:
+                entries.append((used, size, entry))
+
+        for _, size, entry in sorted(entries):
+            if total <= DOWNLOAD_CACHE_MAX_BYTES:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
 
 
 # --- Helper Functions ---
 
+def _remove_dir_in_background(path: Path) -> None:
+    """Delete a directory tree on a background thread so the caller does not wait on it."""
+    threading.Thread(target=shutil.rmtree, args=(path,), kwargs={'ignore_errors': True}).start()
+
+
 def _now_run_id() -> str:
     """Generate a run ID based on current timestamp."""
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace(":", "").replace("+00:00", "Z")
@@ -276,42 +547,113 @@ def _format_timestamp(dt: datetime) -> str:
     return dt.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def upload_grouped_json_to_s3(run_id: str, local_dir: Path, s3_client: Any, bucket: str, base_prefix: str) -> dict[str, Any]:
+def upload_json_file_to_s3(
+    fp: Path,
+    run_id: str,
+    s3_client: Any,
+    bucket: str,
+    base_prefix: str,
+    transfer_config: Any = None,
+    fileobj: BinaryIO | None = None
+) -> dict[str, str]:
     """
-    Upload grouped JSON files to S3.
+    Upload one grouped JSON export file to S3, from disk or from an in-memory buffer.
 
     Args:
+        fp: Local path of the .json.gz or .json.zst file
         run_id: Unique run identifier
-        local_dir: Local directory containing JSON files
         s3_client: Boto3 S3 client instance
         bucket: S3 bucket name
         base_prefix: Base S3 prefix path
+        transfer_config: Optional boto3 TransferConfig for the upload
+        fileobj: Optional buffer holding the file contents; fp then only names the object
 
     Returns:
-        Dict with upload summary
+        Dict with the uploaded key
     """
-    prefix = f"{base_prefix}/{run_id}"
-    file_names = ["system.json.gz", "subcatchments.json.gz", "nodes.json.gz", "links.json.gz"]
-    artifacts = []
+    key = f"{base_prefix}/{run_id}/{fp.name}"
+    extra_args = EXPORT_EXTRA_ARGS[_export_compression_of(fp)]
+    if fileobj is not None:
+        s3_client.upload_fileobj(fileobj, bucket, key, ExtraArgs=extra_args, Config=transfer_config)
+    else:
+        s3_client.upload_file(str(fp), bucket, key, ExtraArgs=extra_args, Config=transfer_config)
+    return {"key": key}
 
-    for name in file_names:
-        fp = local_dir / name
-        if fp.exists():
-            key = f"{prefix}/{name}"
-            s3_client.upload_file(str(fp), bucket, key, ExtraArgs=S3_JSON_EXTRA_ARGS)
-            artifacts.append({"key": key})
 
-    # Create and upload manifest
+def upload_manifest_to_s3(
+    run_id: str,
+    local_dir: Path,
+    s3_client: Any,
+    bucket: str,
+    base_prefix: str,
+    transfer_config: Any = None,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> dict[str, str]:
+    """
+    Write the run manifest listing the grouped JSON files and upload it to S3.
+
+    Args:
+        run_id: Unique run identifier
+        local_dir: Local directory to write manifest.json to
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        base_prefix: Base S3 prefix path
+        transfer_config: Optional boto3 TransferConfig for the upload
+        compression: Compression of the listed export files
+
+    Returns:
+        Dict with the uploaded key
+    """
+    suffix = EXPORT_FILE_SUFFIXES[compression]
     manifest = {
         "run_id": run_id,
-        "groups": ["system", "subcatchments", "nodes", "links"],
-        "files": {name.replace(".json.gz", ""): name for name in file_names}
+        "groups": list(EXPORT_GROUPS),
+        "files": {group: f"{group}{suffix}" for group in EXPORT_GROUPS}
     }
     man = local_dir / "manifest.json"
-    man.write_text(json.dumps(manifest, ensure_ascii=False))
-    s3_client.upload_file(str(man), bucket, f"{prefix}/manifest.json", ExtraArgs=S3_MANIFEST_EXTRA_ARGS)
+    man.write_bytes(_to_json_bytes(manifest))
+    key = f"{base_prefix}/{run_id}/manifest.json"
+    s3_client.upload_file(str(man), bucket, key, ExtraArgs=S3_MANIFEST_EXTRA_ARGS, Config=transfer_config)
+    return {"key": key}
 
-    return {"bucket": bucket, "prefix": prefix, "objects": artifacts + [{"key": f"{prefix}/manifest.json"}]}
+
+def upload_grouped_json_to_s3(
+    run_id: str,
+    local_dir: Path,
+    s3_client: Any,
+    bucket: str,
+    base_prefix: str,
+    transfer_config: Any = None,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> dict[str, Any]:
+    """
+    Upload grouped JSON files to S3, in parallel.
+
+    Args:
+        run_id: Unique run identifier
+        local_dir: Local directory containing JSON files
+        s3_client: Boto3 S3 client instance
+        bucket: S3 bucket name
+        base_prefix: Base S3 prefix path
+        transfer_config: Optional boto3 TransferConfig for the uploads
+        compression: Compression of the export files
+
+    Returns:
+        Dict with upload summary
+    """
+    paths = [local_dir / f"{group}{EXPORT_FILE_SUFFIXES[compression]}" for group in EXPORT_GROUPS]
+    paths = [fp for fp in paths if fp.exists()]
+
+    def upload(fp: Path) -> dict[str, str]:
+        return upload_json_file_to_s3(fp, run_id, s3_client, bucket, base_prefix, transfer_config)
+
+    with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as pool:
+        artifacts = list(pool.map(upload, paths))
+
+    # Create and upload manifest
+    manifest = upload_manifest_to_s3(run_id, local_dir, s3_client, bucket, base_prefix, transfer_config, compression)
+
+    return {"bucket": bucket, "prefix": f"{base_prefix}/{run_id}", "objects": artifacts + [manifest]}
 
 
 def upload_simulation_files_to_s3(
@@ -319,10 +661,15 @@ def upload_simulation_files_to_s3(
     network_file_local: str,
     s3_client: Any,
     bucket: str,
-    base_prefix: str
+    base_prefix: str,
+    transfer_config: Any = None,
+    compress: bool = False
 ) -> dict[str, Any]:
     """
-    Upload simulation files (.out, _mod.inp, .rpt) to S3 with standardized names.
+    Upload simulation files (.out, _mod.inp, .rpt) to S3 with standardized names, in parallel.
+
+    With compress=True each file is gzipped in its upload thread and stored
+    under the same key with Content-Encoding: gzip.
 
     Args:
         run_id: Unique run identifier
@@ -330,33 +677,47 @@ def upload_simulation_files_to_s3(
         s3_client: Boto3 S3 client instance
         bucket: S3 bucket name
         base_prefix: Base S3 prefix path
+        transfer_config: Optional boto3 TransferConfig for the uploads
+        compress: Gzip each file before upload
 
     Returns:
         Dict with upload summary
     """
     prefix = f"{base_prefix}/{run_id}"
-    base_path = network_file_local.replace(".inp", "")
-    uploaded_files = []
 
     # Define file specs: (local_path, s3_filename, extra_args)
     file_specs = [
-        (f"{base_path}_mod.out", "network_mod.out", S3_OUT_FILE_EXTRA_ARGS),
-        (f"{base_path}_mod.inp", "network_mod.inp", S3_INP_FILE_EXTRA_ARGS),
-        (f"{base_path}_mod.rpt", "network_mod.rpt", S3_RPT_FILE_EXTRA_ARGS),
+        (_modified_path(network_file_local, ".out"), "network_mod.out", S3_OUT_FILE_EXTRA_ARGS),
+        (_modified_path(network_file_local, ".inp"), "network_mod.inp", S3_INP_FILE_EXTRA_ARGS),
+        (_modified_path(network_file_local, ".rpt"), "network_mod.rpt", S3_RPT_FILE_EXTRA_ARGS),
     ]
 
-    for local_path_str, s3_filename, extra_args in file_specs:
-        local_path = Path(local_path_str)
-        if local_path.exists():
-            key = f"{prefix}/{s3_filename}"
-            try:
-                s3_client.upload_file(str(local_path), bucket, key, ExtraArgs=extra_args)
-                uploaded_files.append({"key": key, "file": s3_filename})
-                logger.info(f"Uploaded {s3_filename} to S3: {key}")
-            except Exception as e:
-                logger.warning(f"Failed to upload {s3_filename}: {e}")
-        else:
+    def upload(spec: tuple[Path, str, dict[str, str]]) -> dict[str, str] | None:
+        local_path, s3_filename, extra_args = spec
+        if not local_path.exists():
             logger.warning(f"Simulation file not found: {local_path}")
+            return None
+        key = f"{prefix}/{s3_filename}"
+        upload_path = local_path
+        try:
+            if compress:
+                upload_path = local_path.with_name(local_path.name + ".gz")
+                with open(local_path, "rb") as fi, \
+                        gzip.open(upload_path, "wb", compresslevel=SIMULATION_FILE_GZIP_LEVEL) as fo:
+                    shutil.copyfileobj(fi, fo, 1024 * 1024)
+                extra_args = {**extra_args, "ContentEncoding": "gzip"}
+            s3_client.upload_file(str(upload_path), bucket, key, ExtraArgs=extra_args, Config=transfer_config)
+            logger.info(f"Uploaded {s3_filename} to S3: {key}")
+            return {"key": key, "file": s3_filename}
+        except Exception as e:
+            logger.warning(f"Failed to upload {s3_filename}: {e}")
+            return None
+        finally:
+            if upload_path != local_path:
+                upload_path.unlink(missing_ok=True)
+
+    with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as pool:
+        uploaded_files = [result for result in pool.map(upload, file_specs) if result is not None]
 
     return {
         "bucket": bucket,
@@ -366,70 +727,127 @@ def upload_simulation_files_to_s3(
 
 
 # --- JSON Export Functions ---
-def _json_array_writer_gz(path: Path):
-    """Write a JSON object like {"meta": {...}, "series": {...}} with streaming arrays per id.
-       Returns small helpers to open per-id arrays, append rows, and close cleanly."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    f = gzip.open(path, "wt", encoding="utf-8")
-    f.write('{"meta":{')
-    # You can write meta later via direct f.write if desired; keep it simple for now.
-    f.write('},"series":{')
+# Fallback encoder, built once: json.dumps constructs a new encoder on every
+# call that passes options, which adds up over one call per exported entity.
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, check_circular=False)
+
+
+def _to_json_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str dict keys or ints beyond 64 bits, which json accepts
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+
+def _export_compression_of(path: Path) -> ExportCompression:
+    """Return the compression an export or shard file uses, from its suffix."""
+    return ExportCompression.ZSTD if path.suffix == ".zst" else ExportCompression.GZIP
+
+
+def _open_compressed(path: Path, threads: int = 0, fileobj: BinaryIO | None = None):
+    """Open a gzip or zstd (by suffix) file for binary writing, or compress into fileobj if given."""
+    if _export_compression_of(path) == ExportCompression.ZSTD:
+        compressor = zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL, threads=threads)
+        if fileobj is not None:
+            return compressor.stream_writer(fileobj, closefd=False)
+        return compressor.stream_writer(open(path, "wb"))
+    if fileobj is not None:
+        return gzip.GzipFile(filename=path.name, mode="wb", compresslevel=EXPORT_GZIP_LEVEL, fileobj=fileobj)
+    return gzip.open(path, "wb", compresslevel=EXPORT_GZIP_LEVEL)
+
+
+def _compress_member(data: bytes, compression: ExportCompression) -> bytes:
+    """Compress bytes as one standalone gzip member or zstd frame."""
+    if compression == ExportCompression.ZSTD:
+        return zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=EXPORT_GZIP_LEVEL)
+
+
+def _json_array_writer_gz(path: Path, fileobj: BinaryIO | None = None, header: bytes | None = None):
+    """Write a JSON object like {"meta": {...}, "series": {...}} to a gzip/zstd file, streamed per id.
+       With fileobj, the compressed bytes go there instead of to path.
+       Returns helpers to write one pre-serialized '"id":{...}' member and to close cleanly."""
+    if fileobj is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    f = _open_compressed(path, threads=-1, fileobj=fileobj)
+    f.write(header or _SERIES_HEADER)
     first_id = True
 
-    def open_id(id_):
+    def write_member(member: bytes):
         nonlocal first_id
-        if not first_id: f.write(",")
+        if not first_id: f.write(b",")
         first_id = False
-        f.write(json.dumps(id_)); f.write(":{")  # start object for this id
-        return _PerIdWriter(f)
+        f.write(member)
 
     def close():
-        f.write("}}")
+        f.write(_SERIES_FOOTER)
         f.close()
 
-    class _PerIdWriter:
-        def __init__(self, fileobj):
-            self.f = fileobj
-            self._first_attr = True
-            self._open_arrays = set()
-
-        def open_attr(self, attr_name):
-            if not self._first_attr: self.f.write(",")
-            self._first_attr = False
-            self.f.write(json.dumps(attr_name)); self.f.write(":[")  # start array
-            self._open_arrays.add(attr_name)
-            return _AttrAppender(self.f, self._open_arrays, attr_name)
-
-        def close_id(self):
-            # close any arrays not explicitly closed (safety)
-            # (In our use we always close per-attr properly.)
-            self.f.write("}")
-
-    class _AttrAppender:
-        def __init__(self, fileobj, registry, attr_name):
-            self.f = fileobj
-            self._first = True
-            self._registry = registry
-            self._attr = attr_name
-        def append(self, ts_iso, value):
-            if not self._first: self.f.write(",")
-            self._first = False
-            # [timestamp, value]
-            self.f.write('['); self.f.write(json.dumps(ts_iso)); self.f.write(',')
-            # keep float compact
-            self.f.write(json.dumps(float(value))); self.f.write(']')
-        def close_attr(self):
-            self.f.write("]")
-            self._registry.discard(self._attr)
-
-    return open_id, close
+    return write_member, close
+
+
+_SERIES_HEADER = b'{"meta":{},"series":{'
+_SERIES_FOOTER = b"}}"
+
+
+def _series_header(times: list[str], layout: ExportLayout) -> bytes:
+    """Return the document opening up to the first series member; columnar files carry meta.t."""
+    if layout == ExportLayout.COLUMNAR:
+        return b'{"meta":{"t":' + _to_json_bytes(times) + b'},"series":{'
+    return _SERIES_HEADER
+
+
+def _iter_series_members(
+    entity_ids: list[str],
+    attrs: list,
+    series_getter,
+    times: list[str],
+    layout: ExportLayout = ExportLayout.PAIRS
+):
+    """
+    Yield one '"id":{attr: [[timestamp, value], ...], ...}' JSON member per entity.
+
+    With the columnar layout each attribute is just [value, ...], aligned
+    with the timestamps in meta.t. Each entity's attribute arrays are
+    serialized in one call rather than value by value. Attributes the getter
+    fails on are skipped with a warning (logged once per attribute), but an
+    entity none of whose attributes can be read raises RuntimeError rather
+    than being exported as an empty object.
+    """
+    columnar = layout == ExportLayout.COLUMNAR
+    failed_attrs = set()
+    for entity_id in entity_ids:
+        series = {}
+        for attr in attrs:
+            try:
+                values = series_getter(entity_id, attr)
+            except Exception as e:
+                # The toolkit raises plain Exceptions (e.g. for an attribute the
+                # file does not report), so the type cannot be narrowed further
+                if attr not in failed_attrs:
+                    failed_attrs.add(attr)
+                    logger.warning(f"Skipping {attr.name} series, first failed for '{entity_id}': {e}")
+                continue
+            # The toolkit already returns Python floats, and both JSON encoders
+            # write (timestamp, value) tuples as two-element arrays
+            series[attr.name] = values if columnar else list(zip(times, values))
+        if attrs and not series:
+            raise RuntimeError(f"No result series could be read for '{entity_id}'")
+        yield _to_json_bytes(entity_id) + b":" + _to_json_bytes(series)
+
 
 def _export_entity_json(
     fp: Path,
     entity_ids: list[str],
     attrs: list,
     series_getter,
-    run_id: str
+    times: list[str],
+    run_id: str,
+    fileobj: BinaryIO | None = None,
+    layout: ExportLayout = ExportLayout.PAIRS
 ) -> Path:
     """
     Generic export function for any entity type.
@@ -438,73 +856,304 @@ def _export_entity_json(
         fp: Output file path
         entity_ids: List of entity IDs to export
         attrs: List of attributes to export for each entity
-        series_getter: Function to get time series data (entity_id, attr) -> series
+        series_getter: Function to get a whole time series as a list of values (entity_id, attr) -> values
+        times: Formatted timestamps, one per reporting period
         run_id: Run identifier
+        fileobj: Optional buffer to write the compressed document to instead of fp
+        layout: Pairs or columnar series
 
     Returns:
-        Path to created file
+        Path to created file (only named, not created, when fileobj is given)
     """
-    open_id, finish = _json_array_writer_gz(fp)
-    for entity_id in entity_ids:
-        w = open_id(entity_id)
-        for attr in attrs:
-            try:
-                ser = series_getter(entity_id, attr)
-            except Exception:
-                continue
-            a = w.open_attr(attr.name)
-            for ts, val in ser.items():
-                a.append(_format_timestamp(ts), val)
-            a.close_attr()
-        w.close_id()
+    write_member, finish = _json_array_writer_gz(fp, fileobj, _series_header(times, layout))
+    for member in _iter_series_members(entity_ids, attrs, series_getter, times, layout):
+        write_member(member)
     finish()
     return fp
 
 
-def export_system_json(out: Output, run_id: str, export_dir: Path) -> Path:
-    """Export system-level attributes to JSON."""
-    return _export_entity_json(
-        export_dir / "system.json.gz",
-        ["_"],
-        SYSTEM_ATTRS,
-        lambda _, attr: out.system_series(attr),
-        run_id
+# The exporters read whole series through the SWMM toolkit's array getters on
+# the open output handle, skipping the {datetime: value} dicts that pyswmm's
+# *_series methods build around them. Timestamps are formatted once per run
+# and shared by every series of every group.
+def _report_times(out: Output) -> list[str]:
+    """Format the output's reporting times once, for reuse across all series."""
+    return [_format_timestamp(ts) for ts in out.times]
+
+
+def _entity_source(out: Output, group: str):
+    """
+    Return the entity ids of an export group and a series getter for them.
+
+    Args:
+        out: Open SWMM output
+        group: Key of EXPORT_GROUPS
+
+    Returns:
+        Tuple of (entity ids, (entity_id, attr) -> list of values)
+    """
+    # The toolkit's series end index is inclusive, so the last period is
+    # period - 1 (as pyswmm passes it); out.period itself is out of range
+    handle, last_period = out.handle, out.period - 1
+    if group == "system":
+        return ["_"], lambda _, attr: swmm_output.get_system_series(handle, attr, 0, last_period)
+
+    index, get_series = {
+        "subcatchments": (out.subcatchments, swmm_output.get_subcatch_series),
+        "nodes": (out.nodes, swmm_output.get_node_series),
+        "links": (out.links, swmm_output.get_link_series),
+    }[group]
+    return list(index), lambda entity_id, attr: get_series(handle, index[entity_id], attr, 0, last_period)
+
+
+def _period_major_source(out: Output, group: str):
+    """
+    Like _entity_source, but reads the group's results period by period.
+
+    Each (period, attribute) read returns the values of every entity in the
+    group, so the .out file is scanned in storage order instead of seeking
+    once per (entity, attribute). The whole group is held in memory and
+    transposed into per-entity series.
+
+    Args:
+        out: Open SWMM output
+        group: Key of EXPORT_GROUPS
+
+    Returns:
+        Tuple of (entity ids, (entity_id, attr) -> sequence of values)
+    """
+    handle, period_count = out.handle, out.period
+    if group == "system":
+        index, get_attribute = {"_": 0}, swmm_output.get_system_attribute
+    else:
+        index, get_attribute = {
+            "subcatchments": (out.subcatchments, swmm_output.get_subcatch_attribute),
+            "nodes": (out.nodes, swmm_output.get_node_attribute),
+            "links": (out.links, swmm_output.get_link_attribute),
+        }[group]
+
+    slabs = {attr: [] for attr in EXPORT_GROUPS[group]}
+    for period in range(period_count):
+        for attr in list(slabs):
+            try:
+                slabs[attr].append(get_attribute(handle, period, attr))
+            except Exception as e:
+                # Skip the attribute, as the series reader does
+                logger.warning(f"Skipping {attr.name} of {group}, period {period} failed: {e}")
+                del slabs[attr]
+
+    entity_count = len(index)
+    columns = {
+        attr: list(zip(*periods)) if periods else [()] * entity_count
+        for attr, periods in slabs.items()
+    }
+    return list(index), lambda entity_id, attr: columns[attr][index[entity_id]]
+
+
+def _resolve_read_order(out: Output, group: str, read_order: ExportReadOrder) -> ExportReadOrder:
+    """
+    Pick the read order for one group when read_order is AUTO.
+
+    The .out file stores results period by period, so reading a whole series
+    seeks through the entire file once per (entity, attribute). Reading
+    period slabs scans it once per attribute instead, which wins as soon as a
+    group has more than one entity, as long as the group fits the in-memory
+    budget. Both orders yield the same series, so only speed and memory differ.
+    """
+    if read_order != ExportReadOrder.AUTO:
+        return read_order
+    entity_count = 1 if group == "system" else len(
+        {"subcatchments": out.subcatchments, "nodes": out.nodes, "links": out.links}[group]
     )
+    value_count = entity_count * len(EXPORT_GROUPS[group]) * out.period
+    if entity_count > 1 and value_count <= PERIOD_READ_MAX_VALUES:
+        return ExportReadOrder.PERIOD
+    return ExportReadOrder.SERIES
 
 
-def export_subcatchments_json(out: Output, run_id: str, export_dir: Path) -> Path:
-    """Export subcatchment attributes to JSON."""
+def _export_group_json(
+    out: Output,
+    group: str,
+    export_dir: Path,
+    run_id: str,
+    times: list[str] | None = None,
+    read_order: ExportReadOrder = ExportReadOrder.SERIES,
+    compression: ExportCompression = ExportCompression.GZIP,
+    fileobj: BinaryIO | None = None,
+    layout: ExportLayout = ExportLayout.PAIRS
+) -> Path:
+    """Export one EXPORT_GROUPS group to <group>.json.gz/.zst (or fileobj), formatting timestamps unless given."""
+    read_order = _resolve_read_order(out, group, read_order)
+    source = _period_major_source if read_order == ExportReadOrder.PERIOD else _entity_source
+    entity_ids, series_getter = source(out, group)
     return _export_entity_json(
-        export_dir / "subcatchments.json.gz",
-        list(out.subcatchments),
-        SUBCATCH_ATTRS,
-        out.subcatch_series,
-        run_id
+        export_dir / f"{group}{EXPORT_FILE_SUFFIXES[compression]}",
+        entity_ids,
+        EXPORT_GROUPS[group],
+        series_getter,
+        times if times is not None else _report_times(out),
+        run_id,
+        fileobj,
+        layout
     )
 
 
-def export_nodes_json(out: Output, run_id: str, export_dir: Path) -> Path:
+def export_system_json(
+    out: Output,
+    run_id: str,
+    export_dir: Path,
+    times: list[str] | None = None,
+    read_order: ExportReadOrder = ExportReadOrder.SERIES,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> Path:
+    """Export system-level attributes to JSON."""
+    return _export_group_json(out, "system", export_dir, run_id, times, read_order, compression)
+
+
+def export_subcatchments_json(
+    out: Output,
+    run_id: str,
+    export_dir: Path,
+    times: list[str] | None = None,
+    read_order: ExportReadOrder = ExportReadOrder.SERIES,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> Path:
+    """Export subcatchment attributes to JSON."""
+    return _export_group_json(out, "subcatchments", export_dir, run_id, times, read_order, compression)
+
+
+def export_nodes_json(
+    out: Output,
+    run_id: str,
+    export_dir: Path,
+    times: list[str] | None = None,
+    read_order: ExportReadOrder = ExportReadOrder.SERIES,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> Path:
     """Export node attributes to JSON."""
-    return _export_entity_json(
-        export_dir / "nodes.json.gz",
-        list(out.nodes),
-        NODE_ATTRS,
-        out.node_series,
-        run_id
-    )
+    return _export_group_json(out, "nodes", export_dir, run_id, times, read_order, compression)
 
 
-def export_links_json(out: Output, run_id: str, export_dir: Path) -> Path:
+def export_links_json(
+    out: Output,
+    run_id: str,
+    export_dir: Path,
+    times: list[str] | None = None,
+    read_order: ExportReadOrder = ExportReadOrder.SERIES,
+    compression: ExportCompression = ExportCompression.GZIP
+) -> Path:
     """Export link attributes to JSON."""
-    return _export_entity_json(
-        export_dir / "links.json.gz",
-        list(out.links),
-        LINK_ATTRS,
-        out.link_series,
-        run_id
-    )
+    return _export_group_json(out, "links", export_dir, run_id, times, read_order, compression)
+
+
+def _process_pool_available() -> bool:
+    """
+    Whether worker processes can run this module's functions.
+
+    When the runtime guard registered the module, workers cannot import it by
+    name, so only forked workers (which inherit the registration) can.
+    """
+    return not _loaded_by_guard or "fork" in multiprocessing.get_all_start_methods()
 
 
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool, forking the workers when the runtime guard registered this module."""
+    if not _loaded_by_guard:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    if not _process_pool_available():
+        raise RuntimeError("Worker processes need the 'fork' start method when the metaagent is not importable by name")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"))
+
+
+def _export_shard(
+    out_path: str,
+    group: str,
+    entity_ids: list[str],
+    shard_path: str,
+    times: list[str],
+    layout: ExportLayout = ExportLayout.PAIRS
+) -> str:
+    """
+    Worker: write the series members of some entities as one gzip member or zstd frame.
+
+    Each worker opens its own read-only handle on the .out file. The shard
+    holds comma-separated '"id":{...}' members with no envelope, so shards
+    can be concatenated into a complete document.
+    """
+    with Output(out_path) as out:
+        _, series_getter = _entity_source(out, group)
+        with _open_compressed(Path(shard_path)) as f:
+            members = _iter_series_members(entity_ids, EXPORT_GROUPS[group], series_getter, times, layout)
+            for i, member in enumerate(members):
+                if i: f.write(b",")
+                f.write(member)
+    return shard_path
+
+
+def export_results_parallel(
+    out_path: str,
+    run_id: str,
+    export_dir: Path,
+    max_workers: int,
+    compression: ExportCompression = ExportCompression.GZIP,
+    layout: ExportLayout = ExportLayout.PAIRS
+) -> list[Path]:
+    """
+    Export all groups to JSON, sharding entities across worker processes.
+
+    Every group's entity list is split into contiguous shards that worker
+    processes export concurrently. The shards are then stitched into
+    <group>.json.gz as a multi-member gzip file (header, shards and footer are
+    separate gzip members), which decompresses to the same document as the
+    serial export. With zstd the members are concatenated zstd frames in
+    <group>.json.zst.
+
+    Args:
+        out_path: Path to the SWMM .out file
+        run_id: Run identifier
+        export_dir: Directory to write the JSON files to
+        max_workers: Number of worker processes
+        compression: Compression of the export files
+        layout: Pairs or columnar series
+
+    Returns:
+        Paths to the created files
+    """
+    with Output(out_path) as out:
+        ids_by_group = {group: _entity_source(out, group)[0] for group in EXPORT_GROUPS}
+        times = _report_times(out)
+
+    shard_dir = export_dir / "shards"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    suffix = EXPORT_FILE_SUFFIXES[compression]
+
+    with _process_pool(max_workers) as pool:
+        shards_by_group = {}
+        for group, entity_ids in ids_by_group.items():
+            shard_count = max(1, min(max_workers, len(entity_ids)))
+            size = max(1, -(-len(entity_ids) // shard_count))
+            shards_by_group[group] = [
+                pool.submit(_export_shard, out_path, group, entity_ids[start:start + size],
+                            str(shard_dir / f"{group}_{start}{Path(suffix).suffix}"), times, layout)
+                for start in range(0, len(entity_ids), size)
+            ]
+
+        paths = []
+        for group, futures in shards_by_group.items():
+            fp = export_dir / f"{group}{suffix}"
+            with open(fp, "wb") as f:
+                f.write(_compress_member(_series_header(times, layout), compression))
+                for i, future in enumerate(futures):
+                    if i: f.write(_compress_member(b",", compression))
+                    shard_path = Path(future.result())
+                    with open(shard_path, "rb") as shard:
+                        shutil.copyfileobj(shard, f, 1024 * 1024)
+                    shard_path.unlink()
+                f.write(_compress_member(_SERIES_FOOTER, compression))
+            paths.append(fp)
+
+    shard_dir.rmdir()
+    return paths
 
 
 # --- PreConfig Builders ---
@@ -538,14 +1187,15 @@ class PreConfigBuilder:
 
     def add_timeseries(
         self,
-        timeseries_data: dict[str, list[str]],
+        timeseries_data: dict[str, list[str] | str],
         temp_dir: Path
     ) -> PreConfigBuilder:
         """
         Add TIMESERIES section modifications.
 
         Args:
-            timeseries_data: Dict of timeseries_name: list of data lines
+            timeseries_data: Dict of timeseries_name: list of data lines, or
+                the lines already joined into one newline-separated string
             temp_dir: Temporary directory for timeseries files
 
         Returns:
@@ -553,7 +1203,15 @@ class PreConfigBuilder:
         """
         for ts_name, ts_lines in timeseries_data.items():
             ts_file = temp_dir / f"{ts_name}.txt"
-            ts_file.write_text('\n'.join(line.rstrip() for line in ts_lines) + '\n', encoding='utf-8')
+            # Stream the lines through a large buffer rather than joining them into one string
+            with open(ts_file, 'wb', buffering=TIMESERIES_WRITE_BUFFER) as f:
+                if isinstance(ts_lines, str):
+                    # Pre-joined block (e.g. from weather_to_pyswmm) - write it in one go
+                    f.write(ts_lines.encode('utf-8'))
+                    if ts_lines and not ts_lines.endswith('\n'):
+                        f.write(b'\n')
+                else:
+                    f.writelines(line.rstrip().encode('utf-8') + b'\n' for line in ts_lines)
             ts_file.chmod(0o644)
 
             # Store reference and update preconfig
@@ -570,8 +1228,10 @@ class PreConfigBuilder:
 
 
 def _parse_input(data: Any) -> dict[str, Any]:
-    """Parse input data, handling both dict and JSON string formats."""
-    return json.loads(data) if isinstance(data, str) else data
+    """Parse input data, handling both dict and JSON string/bytes formats."""
+    if isinstance(data, (str, bytes)):
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    return data
 
 
 def build_preconfig(
@@ -603,6 +1263,35 @@ def build_preconfig(
 
 
 # --- Simulation Runner ---
+@contextmanager
+def _suppress_native_stdout():
+    """
+    Discard output written to file descriptor 1 while the block runs.
+
+    swmmExec prints the SWMM version banner, a "Simulating day" progress line and
+    "Run Complete" straight to the C stdout, bypassing sys.stdout and logging.
+    The redirect is process-wide, so other threads' stdout output is also dropped
+    for the duration of the block.
+    """
+    try:
+        saved_fd = os.dup(1)
+    except OSError:
+        # No stdout descriptor to redirect
+        yield
+        return
+
+    if sys.stdout is not None:
+        sys.stdout.flush()
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull_fd, 1)
+        yield
+    finally:
+        os.dup2(saved_fd, 1)
+        os.close(devnull_fd)
+        os.close(saved_fd)
+
+
 @contextmanager
 def run_simulation(
     network_file: str,
@@ -615,7 +1304,7 @@ def run_simulation(
     Args:
         network_file: Path to SWMM .inp file
         preconfig: Optional SimulationPreConfig for modifications
-        progress_interval: Print progress every N steps
+        progress_interval: Log progress every N steps (the step loop only runs at DEBUG level)
 
     Yields:
         Simulation object
@@ -626,9 +1315,15 @@ def run_simulation(
         logger.info(f"Starting simulation: {network_file}")
 
         with sim:
-            for step_idx, step in enumerate(sim):
-                if step_idx % progress_interval == 0:
-                    logger.debug(f"Step {step_idx}: {step}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for step_idx, step in enumerate(sim):
+                    if step_idx % progress_interval == 0:
+                        logger.debug(f"Step {step_idx}: {step}")
+            else:
+                # No progress logging, so let SWMM run without a Python call per step;
+                # swmmExec's console progress would otherwise end up in the runtime's stdout
+                with _suppress_native_stdout():
+                    sim.execute()
 
         logger.info("Simulation completed successfully")
         yield sim
@@ -669,7 +1364,13 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
         "aws_secret_access_key": "YOUR_SECRET_KEY",
         "region_name": "us-east-1",
         "bucket": "xmtwin",
-        "prefix_base": "water_utilities/flood_management"
+        "prefix_base": "water_utilities/flood_management",
+        "export_workers": 1,  # optional, processes for the JSON export (1 = serial)
+        "compress_simulation_files": false,  # optional, gzip .out/.inp/.rpt uploads
+        "export_read_order": "auto",  # optional, "auto", "series" or "period"
+        "export_compression": "gzip",  # optional, "gzip" or "zstd" (needs zstandard)
+        "export_in_memory": false,  # optional, upload serial exports from memory
+        "export_layout": "pairs"  # optional, "pairs" or "columnar"
     }
 
     Args:
@@ -679,7 +1380,9 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
         Status dictionary with initialization results
 
     Raises:
-        ValueError: If network_file missing or source_type invalid
+        ValueError: If network_file missing, or source_type, export_read_order,
+            export_compression or export_layout invalid, or export_workers > 1
+            where worker processes cannot run the metaagent
         RuntimeError: If file download/access fails
     """
     global _state
@@ -696,21 +1399,11 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
         temp_dir=temp_dir
     )
 
-    # Get local file path (downloads if necessary)
-    local_path = FileSourceManager.get_local_path(
-        config.network_file,
-        config.source_type,
-        config.temp_dir
-    )
-    config.network_file_local = local_path
-
-    # Store network config in global state
-    _state.config = config
-
     # Configure S3 settings if provided (check for any S3 keys)
     aws_access_key_id = data.get('aws_access_key_id')
     if aws_access_key_id:
         import boto3
+        from boto3.s3.transfer import TransferConfig
 
         # Create S3Config with flattened parameters
         s3_config = S3Config(
@@ -721,18 +1414,53 @@ def on_create(data: dict[str, Any]) -> dict[str, Any]:
             prefix_base=data.get('prefix_base', 'water_utilities/flood_management')
         )
 
-        # Create S3 client with provided credentials
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=s3_config.aws_access_key_id,
-            aws_secret_access_key=s3_config.aws_secret_access_key,
-            region_name=s3_config.region_name
-        )
+        # Reuse the existing client when re-created with the same credentials
+        previous = _state.s3_config
+        if (
+            _state.s3_client is not None
+            and previous is not None
+            and (previous.aws_access_key_id, previous.aws_secret_access_key, previous.region_name)
+            == (s3_config.aws_access_key_id, s3_config.aws_secret_access_key, s3_config.region_name)
+        ):
+            s3_client = _state.s3_client
+        else:
+            # Create S3 client with provided credentials
+            s3_client = boto3.client(
+                "s3",
+                aws_access_key_id=s3_config.aws_access_key_id,
+                aws_secret_access_key=s3_config.aws_secret_access_key,
+                region_name=s3_config.region_name
+            )
 
         _state.s3_config = s3_config
         _state.s3_client = s3_client
+        _state.transfer_config = TransferConfig(**S3_TRANSFER_CONFIG)
         logger.info(f"S3 configured: bucket={s3_config.bucket}, region={s3_config.region_name}")
 
+    # Get local file path (downloads if necessary, reusing the S3 client above)
+    local_path = FileSourceManager.get_local_path(
+        config.network_file,
+        config.source_type,
+        config.temp_dir
+    )
+    config.network_file_local = local_path
+
+    # Store network config in global state
+    _state.config = config
+    if _state.work_dir is not None:
+        _remove_dir_in_background(_state.work_dir)
+    _state.work_dir = Path(mkdtemp(prefix='swmm_state_'))
+    _state.export_workers = max(1, int(data.get('export_workers', 1)))
+    if _state.export_workers > 1 and not _process_pool_available():
+        raise ValueError("export_workers > 1 needs the 'fork' start method when the metaagent is not importable by name")
+    _state.compress_simulation_files = bool(data.get('compress_simulation_files', False))
+    _state.export_read_order = ExportReadOrder(data.get('export_read_order', ExportReadOrder.AUTO))
+    _state.export_compression = ExportCompression(data.get('export_compression', ExportCompression.GZIP))
+    if _state.export_compression == ExportCompression.ZSTD and zstandard is None:
+        raise ValueError("export_compression 'zstd' requires the zstandard package")
+    _state.export_in_memory = bool(data.get('export_in_memory', False))
+    _state.export_layout = ExportLayout(data.get('export_layout', ExportLayout.PAIRS))
+
     logger.info(f"Metaagent initialized: {config.source_type.value} source")
 
     return {
@@ -775,10 +1503,9 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
     modifications = data.get('modifications', {})
     modifications_parsed = _parse_input(modifications)
 
-    # Use temporary directory for timeseries files
-    with TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
+    # Each run works in its own subdirectory of the long-lived work directory
+    temp_path = Path(mkdtemp(prefix='run_', dir=_state.work_dir))
+    try:
         # Build preconfig if modifications provided
         preconfig = None
         if modifications_parsed:
@@ -793,33 +1520,69 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
         export_dir = temp_path / "exports"
         export_dir.mkdir(parents=True, exist_ok=True)
         run_id = _now_run_id()
-
-        with Output(f'{_state.config.network_file_local.replace(".inp", "_mod.out")}') as out:
-            export_links_json(out, run_id, export_dir)
-            export_nodes_json(out, run_id, export_dir)
-            export_subcatchments_json(out, run_id, export_dir)
-            export_system_json(out, run_id, export_dir)
+        s3_enabled = bool(_state.s3_client and _state.s3_config)
+
+        # Uploads run in the background so the network works while the CPU exports
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as upload_pool:
+            uploads = []
+            if s3_enabled:
+                s3_args = dict(
+                    run_id=run_id,
+                    s3_client=_state.s3_client,
+                    bucket=_state.s3_config.bucket,
+                    base_prefix=_state.s3_config.prefix_base,
+                    transfer_config=_state.transfer_config
+                )
+                # Simulation files (.out, _mod.inp, .rpt) are final once the simulation closes
+                uploads.append(upload_pool.submit(
+                    upload_simulation_files_to_s3,
+                    network_file_local=_state.config.network_file_local,
+                    compress=_state.compress_simulation_files,
+                    **s3_args
+                ))
+
+            def exported(fp: Path) -> None:
+                """Start uploading an export file as soon as it is written."""
+                if s3_enabled:
+                    uploads.append(upload_pool.submit(upload_json_file_to_s3, fp, **s3_args))
+
+            out_path = str(_state.config.mod_out)
+            compression = _state.export_compression
+            layout = _state.export_layout
+            if _state.export_workers > 1:
+                for fp in export_results_parallel(
+                    out_path, run_id, export_dir, _state.export_workers, compression, layout
+                ):
+                    exported(fp)
+            else:
+                with Output(out_path) as out:
+                    times = _report_times(out)
+                    read_order = _state.export_read_order
+                    for group in ("links", "nodes", "subcatchments", "system"):
+                        if s3_enabled and _state.export_in_memory:
+                            # Compress straight into memory and hand the buffer to S3
+                            buffer = BytesIO()
+                            fp = _export_group_json(
+                                out, group, export_dir, run_id, times, read_order, compression, buffer, layout
+                            )
+                            buffer.seek(0)
+                            uploads.append(upload_pool.submit(upload_json_file_to_s3, fp, fileobj=buffer, **s3_args))
+                        else:
+                            exported(_export_group_json(
+                                out, group, export_dir, run_id, times, read_order, compression, layout=layout
+                            ))
+
+            if s3_enabled:
+                uploads.append(upload_pool.submit(
+                    upload_manifest_to_s3, local_dir=export_dir, compression=compression, **s3_args
+                ))
+
+            # Surface any upload error
+            for future in uploads:
+                future.result()
 
         # Upload to S3 if configured
-        if _state.s3_client and _state.s3_config:
-            # Upload JSON results
-            upload_grouped_json_to_s3(
-                run_id=run_id,
-                local_dir=export_dir,
-                s3_client=_state.s3_client,
-                bucket=_state.s3_config.bucket,
-                base_prefix=_state.s3_config.prefix_base
-            )
-
-            # Upload simulation files (.out, _mod.inp, .rpt)
-            upload_simulation_files_to_s3(
-                run_id=run_id,
-                network_file_local=_state.config.network_file_local,
-                s3_client=_state.s3_client,
-                bucket=_state.s3_config.bucket,
-                base_prefix=_state.s3_config.prefix_base
-            )
-
+        if s3_enabled:
             # Construct the S3 path to the .rpt file
             rpt_s3_path = f"s3://{_state.s3_config.bucket}/{_state.s3_config.prefix_base}/{run_id}/network_mod.rpt"
 
@@ -837,6 +1600,8 @@ def on_receive(data: dict[str, Any]) -> dict[str, Any]:
                 'run_id': run_id,
                 'rpt_s3_path': None
             }
+    finally:
+        _remove_dir_in_background(temp_path)
 
 
 def on_destroy(data: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -868,6 +1633,10 @@ def on_destroy(data: dict[str, Any] | None = None) -> dict[str, Any]:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup temp directory: {e}")
 
+    # Remove the work directory without blocking shutdown
+    if _state.work_dir is not None:
+        _remove_dir_in_background(_state.work_dir)
+
     # Reset state
     _state.reset()
     logger.info("Metaagent destroyed")
@@ -24,10 +24,36 @@ from dataclasses import dataclass
 import json
 import random
 
+try:
+    import numpy as np
+except ImportError:  # optional - random walks fall back to the pure-Python loop
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional - clamped walks step through NumPy row by row
+    njit = None
+
 
 # Global state
 _config: Dict[str, Any] = {}
 
+# Weather fields in output column order (after the timestamp)
+WEATHER_FIELDS = ('precipitation', 'temperature', 'atmospheric_pressure',
+                  'humidity', 'wind_speed', 'wind_direction')
+
+# Random generator for the NumPy random walk (replaced in _config by on_create's random_seed)
+_rng = np.random.default_rng() if np is not None else None
+
+# Bound once: random.random is cheaper than random.uniform in the step loop
+_rand = random.random
+
+# Parsed per-area weather ranges kept for reuse across on_receive calls
+WEATHER_RANGES_CACHE_SIZE = 128
+
+# Output layouts: list of row tuples per area, or shared timestamps + value matrix
+OUTPUT_LAYOUTS = ('rows', 'columnar')
+
 
 @dataclass
 class WeatherRanges:
@@ -81,12 +107,13 @@ def _parse_timestamp(timestamp_str: str) -> datetime:
     return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
 
 
-def _clamp(value: float, min_val: float, max_val: float) -> float:
-    """Clamp value between min and max"""
-    return max(min_val, min(max_val, value))
-
-
-def _random_walk_step(current: float, step_size: float, min_val: float, max_val: float) -> float:
+def _random_walk_step(
+    current: float,
+    step_size: float,
+    min_val: float,
+    max_val: float,
+    unit: Optional[float] = None
+) -> float:
     """
     Perform one random walk step.
 
@@ -95,16 +122,108 @@ def _random_walk_step(current: float, step_size: float, min_val: float, max_val:
         step_size: Maximum change per step
         min_val: Minimum allowed value
         max_val: Maximum allowed value
+        unit: Pre-drawn uniform value in [-1, 1) (drawn here if not given)
 
     Returns:
         New value after random walk step
     """
+    if unit is None:
+        unit = _rand() * 2.0 - 1.0
+
     # Random change: uniform distribution between -step_size and +step_size
-    change = random.uniform(-step_size, step_size)
-    new_value = current + change
+    new_value = current + unit * step_size
 
     # Clamp to min/max bounds
-    return _clamp(new_value, min_val, max_val)
+    if new_value < min_val:
+        return min_val
+    if new_value > max_val:
+        return max_val
+    return new_value
+
+
+def _clamp_columns(start: 'np.ndarray', deltas: 'np.ndarray', lo: 'np.ndarray', hi: 'np.ndarray') -> 'np.ndarray':
+    """Step-by-step clamped walk over (T, K) deltas; compiled with Numba when installed"""
+    num_steps, num_cols = deltas.shape
+    walk = np.empty_like(deltas)
+    x = start.copy()
+    for t in range(num_steps):
+        for k in range(num_cols):
+            value = x[k] + deltas[t, k]
+            if value < lo[k]:
+                value = lo[k]
+            elif value > hi[k]:
+                value = hi[k]
+            x[k] = value
+            walk[t, k] = value
+    return walk
+
+
+if njit is not None:
+    _clamp_columns = njit(_clamp_columns)
+
+
+def _clamped_walk(start: 'np.ndarray', deltas: 'np.ndarray', lo: 'np.ndarray', hi: 'np.ndarray') -> 'np.ndarray':
+    """
+    Clamped cumulative random walk over independent columns.
+
+    Row t is clip(row t-1 + deltas[t], lo, hi), with row -1 = start - the same
+    recurrence as repeated _random_walk_step calls. Columns whose plain cumsum
+    never leaves its bounds are exact as computed; only columns that hit a
+    bound are re-run step by step: in the Numba kernel when installed,
+    otherwise one vectorized NumPy step per row.
+
+    Args:
+        start: Starting values, shape (K,)
+        deltas: Random changes, shape (T, K)
+        lo: Minimum values, shape (K,)
+        hi: Maximum values, shape (K,)
+
+    Returns:
+        Walk values, shape (T, K)
+    """
+    walk = start + deltas.cumsum(axis=0)
+    hit = ((walk < lo) | (walk > hi)).any(axis=0)
+    if hit.any():
+        cols = np.flatnonzero(hit)
+        x = start[cols].copy()
+        col_deltas, col_lo, col_hi = deltas[:, cols], lo[cols], hi[cols]
+        if njit is not None:
+            clamped = _clamp_columns(x, np.ascontiguousarray(col_deltas), col_lo, col_hi)
+        else:
+            clamped = np.empty_like(col_deltas)
+            for t in range(len(col_deltas)):
+                x += col_deltas[t]
+                np.clip(x, col_lo, col_hi, out=x)
+                clamped[t] = x
+        walk[:, cols] = clamped
+    return walk
+
+
+def _random_walk_series(areas: List[Area], num_timesteps: int, dtype: Any = float) -> 'np.ndarray':
+    """
+    Generate the random walks of several areas at once with NumPy.
+
+    Starting values, step sizes and bounds are laid out as (areas, 6) arrays,
+    so one draw and one clamped walk cover every area and weather field.
+
+    Args:
+        areas: Areas with starting values and weather_ranges
+        num_timesteps: Number of timesteps
+        dtype: Float dtype the walk is computed and returned in
+
+    Returns:
+        Walk values, shape (timesteps, areas, 6), fields in WEATHER_FIELDS order
+    """
+    start = np.array([[getattr(a, f) for f in WEATHER_FIELDS] for a in areas], dtype=dtype)
+    steps = np.array([[getattr(a.weather_ranges, f + '_step') for f in WEATHER_FIELDS] for a in areas], dtype=dtype)
+    mins = np.array([[getattr(a.weather_ranges, f + '_min') for f in WEATHER_FIELDS] for a in areas], dtype=dtype)
+    maxs = np.array([[getattr(a.weather_ranges, f + '_max') for f in WEATHER_FIELDS] for a in areas], dtype=dtype)
+
+    steps = steps.ravel()
+    rng = _config.get('rng', _rng)
+    deltas = rng.uniform(-steps, steps, size=(num_timesteps, steps.size)).astype(dtype, copy=False)
+    walk = _clamped_walk(start.ravel(), deltas, mins.ravel(), maxs.ravel())
+    return walk.reshape(num_timesteps, len(areas), len(WEATHER_FIELDS))
 
 
 def _parse_weather_ranges(ranges_data: Dict[str, Any], default_ranges: WeatherRanges) -> WeatherRanges:
@@ -134,6 +253,56 @@ def _parse_weather_ranges(ranges_data: Dict[str, Any], default_ranges: WeatherRa
     )
 
 
+def to_tuples(area_output: Dict[str, Any]) -> List[tuple]:
+    """
+    Convert one area of on_receive output to the row layout.
+
+    Args:
+        area_output: An area_timeseries entry in either layout
+
+    Returns:
+        List of (timestamp, precip, temp, pressure, humidity, wind_speed, wind_direction) tuples
+    """
+    if 'timeseries' in area_output:
+        return area_output['timeseries']
+    values = area_output['values']
+    if np is not None and isinstance(values, np.ndarray):
+        values = values.tolist()
+    return [(timestamp, *row) for timestamp, row in zip(area_output['timestamps'], values)]
+
+
+def _area_weather_ranges(ranges_data: Any, default_ranges: WeatherRanges) -> WeatherRanges:
+    """
+    Parse an area's weather ranges, reusing the result for identical inputs.
+
+    Parsed ranges are cached in _config, keyed by the raw JSON string or the
+    sorted dict items, so repeated requests with the same ranges share one
+    WeatherRanges instead of rebuilding it. The cache is reset by on_create,
+    since it depends on the default ranges.
+    """
+    if not ranges_data:
+        return default_ranges
+
+    cache = _config.setdefault('weather_ranges_cache', {})
+    try:
+        key = ranges_data if isinstance(ranges_data, str) else tuple(sorted(ranges_data.items()))
+        cached = cache.get(key)
+    except TypeError:  # unhashable values - parse without caching
+        key = cached = None
+    if cached is not None:
+        return cached
+
+    if isinstance(ranges_data, str):
+        ranges_data = json.loads(ranges_data)
+    weather_ranges = _parse_weather_ranges(ranges_data, default_ranges)
+
+    if key is not None:
+        if len(cache) >= WEATHER_RANGES_CACHE_SIZE:
+            cache.clear()
+        cache[key] = weather_ranges
+    return weather_ranges
+
+
 def on_create(data: Any) -> Dict[str, Any]:
     """
     Initialize weather simulation with default weather ranges.
@@ -141,6 +310,10 @@ def on_create(data: Any) -> Dict[str, Any]:
     Args:
         data: Dict with flat parameters:
             - use_random_walk: bool (default False)
+            - output_layout: 'rows' (default) or 'columnar'
+            - float32_values: bool (default False) - generate NumPy walks and
+              columnar values in float32
+            - random_seed: int (optional) - seed the random walks for reproducible runs
             - precipitation_min: float (default 0.0)
             - precipitation_max: float (default 50.0)
             - precipitation_step: float (default 2.0)
@@ -167,6 +340,9 @@ def on_create(data: Any) -> Dict[str, Any]:
 
     # Parse flat parameters
     use_random_walk = bool(data.get('use_random_walk', False))
+    output_layout = data.get('output_layout', 'rows')
+    if output_layout not in OUTPUT_LAYOUTS:
+        raise ValueError(f"output_layout must be one of {OUTPUT_LAYOUTS}, got {output_layout!r}")
 
     default_weather_ranges = WeatherRanges(
         precipitation_min=float(data.get('precipitation_min', 0.0)),
@@ -190,7 +366,21 @@ def on_create(data: Any) -> Dict[str, Any]:
     )
 
     _config['default_weather_ranges'] = default_weather_ranges
+    _config['weather_ranges_cache'] = {}
     _config['use_random_walk'] = use_random_walk
+    _config['output_layout'] = output_layout
+    _config['float32_values'] = bool(data.get('float32_values', False))
+
+    # Seeded generators make random walks reproducible across runs
+    random_seed = data.get('random_seed')
+    if random_seed is not None:
+        _config['rand'] = random.Random(int(random_seed)).random
+        if np is not None:
+            _config['rng'] = np.random.default_rng(int(random_seed))
+    else:
+        # Drop generators seeded by an earlier on_create
+        _config.pop('rand', None)
+        _config.pop('rng', None)
 
     return {
         'status': 'initialized',
@@ -230,6 +420,9 @@ def on_receive(data: Any) -> Dict[str, Any]:
                     "timeseries": [(timestamp, precip, temp, ...)]
                 }
             }
+        With output_layout='columnar', each area has "timestamps" (shared list)
+        and "values" ((T, 6) array with NumPy, else list of rows) instead of
+        "timeseries".
     """
 
     # Parse timeseries parameters
@@ -245,22 +438,21 @@ def on_receive(data: Any) -> Dict[str, Any]:
     else:
         start_time = datetime.now(timezone.utc)
 
-    # Calculate end time and time step
+    # Calculate end time, time step and the number of timesteps (start and end inclusive)
     time_step = timedelta(seconds=time_delta_seconds)
     end_time = start_time + timedelta(seconds=total_time_seconds)
+    num_timesteps = max(0, total_time_seconds // time_delta_seconds + 1)
 
     # Parse areas
     default_ranges = _config['default_weather_ranges']
     use_random_walk = bool(_config.get('use_random_walk', False))
+    columnar = _config.get('output_layout', 'rows') == 'columnar'
+    value_dtype = np.float32 if np is not None and _config.get('float32_values', False) else float
 
     areas = []
     for area_data in area_data_parsed:
         # Parse per-area weather ranges if provided
-        area_ranges_data = area_data.get('weather_ranges', {})
-        if isinstance(area_ranges_data, str):
-            area_ranges_data = json.loads(area_ranges_data)
-
-        area_weather_ranges = _parse_weather_ranges(area_ranges_data, default_ranges)
+        area_weather_ranges = _area_weather_ranges(area_data.get('weather_ranges', {}), default_ranges)
 
         area = Area(
             name=area_data['name'],
@@ -276,115 +468,104 @@ def on_receive(data: Any) -> Dict[str, Any]:
         )
         areas.append(area)
 
+    # Per-area state below is indexed by position in areas, not by name
+
     # Initialize timeseries storage for each area
-    area_timeseries = {area.name: [] for area in areas}
-
-    # Initialize current weather state for random walk (one per area)
-    current_weather_state = {}
-    for area in areas:
-        current_weather_state[area.name] = {
-            'precipitation': area.precipitation,
-            'temperature': area.temperature,
-            'atmospheric_pressure': area.atmospheric_pressure,
-            'humidity': area.humidity,
-            'wind_speed': area.wind_speed,
-            'wind_direction': area.wind_direction
-        }
-
-    # Iterate through time
-    current_time = start_time
-
-    while current_time <= end_time:
-        # Generate weather data for each area
-        for area in areas:
-            if use_random_walk and area.weather_ranges:
-                # Apply random walk to current state using area-specific ranges
-                state = current_weather_state[area.name]
-                ranges = area.weather_ranges
-
-                state['precipitation'] = _random_walk_step(
-                    state['precipitation'],
-                    ranges.precipitation_step,
-                    ranges.precipitation_min,
-                    ranges.precipitation_max
-                )
-                state['temperature'] = _random_walk_step(
-                    state['temperature'],
-                    ranges.temperature_step,
-                    ranges.temperature_min,
-                    ranges.temperature_max
-                )
-                state['atmospheric_pressure'] = _random_walk_step(
-                    state['atmospheric_pressure'],
-                    ranges.atmospheric_pressure_step,
-                    ranges.atmospheric_pressure_min,
-                    ranges.atmospheric_pressure_max
-                )
-                state['humidity'] = _random_walk_step(
-                    state['humidity'],
-                    ranges.humidity_step,
-                    ranges.humidity_min,
-                    ranges.humidity_max
-                )
-                state['wind_speed'] = _random_walk_step(
-                    state['wind_speed'],
-                    ranges.wind_speed_step,
-                    ranges.wind_speed_min,
-                    ranges.wind_speed_max
-                )
-                state['wind_direction'] = _random_walk_step(
-                    state['wind_direction'],
-                    ranges.wind_direction_step,
-                    ranges.wind_direction_min,
-                    ranges.wind_direction_max
+    area_timeseries = [[] for _ in areas]
+
+    # Initialize current weather state for random walk (one per area),
+    # as a list of values in WEATHER_FIELDS order
+    current_weather_state = [[getattr(area, field) for field in WEATHER_FIELDS] for area in areas]
+
+    # With NumPy, generate every area's whole random walk up front in one go;
+    # without it, draw each area's random changes in one pass before the time loop
+    precomputed_values = [None] * len(areas)
+    unit_draws = [None] * len(areas)
+    walk_bounds = [None] * len(areas)
+    if use_random_walk:
+        walk_indices = [area_idx for area_idx, area in enumerate(areas) if area.weather_ranges]
+        if np is not None:
+            walks = _random_walk_series([areas[area_idx] for area_idx in walk_indices], num_timesteps, value_dtype)
+            for walk_idx, area_idx in enumerate(walk_indices):
+                walk = walks[:, walk_idx, :]
+                # Columnar output keeps the array; rows are only needed for tuples
+                precomputed_values[area_idx] = walk if columnar else walk.tolist()
+        else:
+            for area_idx in walk_indices:
+                rand = _config.get('rand', _rand)
+                draws = [rand() * 2.0 - 1.0 for _ in range(6 * num_timesteps)]
+                unit_draws[area_idx] = iter(draws).__next__
+
+                # (step, min, max) per field, read off the ranges once
+                ranges = areas[area_idx].weather_ranges
+                walk_bounds[area_idx] = tuple(
+                    (getattr(ranges, field + '_step'), getattr(ranges, field + '_min'), getattr(ranges, field + '_max'))
+                    for field in WEATHER_FIELDS
                 )
 
-                # Create area with current state
-                current_area = Area(
-                    name=area.name,
-                    x=area.x,
-                    y=area.y,
-                    precipitation=state['precipitation'],
-                    temperature=state['temperature'],
-                    atmospheric_pressure=state['atmospheric_pressure'],
-                    humidity=state['humidity'],
-                    wind_speed=state['wind_speed'],
-                    wind_direction=state['wind_direction']
-                )
+    # Format every timestamp once; all areas share them
+    timestamps = [(start_time + step_index * time_step).isoformat() for step_index in range(num_timesteps)]
+
+    # Areas that don't step through the walk below are filled in one go:
+    # precomputed NumPy walks, and static areas whose starting values repeat
+    stepped_indices = []
+    for area_idx, area in enumerate(areas):
+        walk = precomputed_values[area_idx]
+        if walk is None:
+            if use_random_walk and area.weather_ranges:
+                stepped_indices.append(area_idx)
+                continue
+            static_values = tuple(current_weather_state[area_idx])
+            if columnar and np is not None:
+                walk = np.tile(np.array(static_values, dtype=value_dtype), (len(timestamps), 1))
             else:
-                # Use static values from initial area
-                current_area = area
+                walk = [static_values] * len(timestamps)
+            precomputed_values[area_idx] = walk
+        if not columnar:
+            area_timeseries[area_idx] = [(timestamp, *row) for timestamp, row in zip(timestamps, walk)]
+
+    # Iterate through time for the pure-Python random walks
+    random_walk_step = _random_walk_step
 
-            # Store as tuple
-            data_tuple = (
-                current_time.isoformat(),
-                current_area.precipitation,
-                current_area.temperature,
-                current_area.atmospheric_pressure,
-                current_area.humidity,
-                current_area.wind_speed,
-                current_area.wind_direction
-            )
+    for timestamp in timestamps:
+        for area_idx in stepped_indices:
+            # Apply random walk to current state using area-specific ranges
+            state = current_weather_state[area_idx]
+            next_unit = unit_draws[area_idx]
 
-            area_timeseries[area.name].append(data_tuple)
+            for field_idx, (step, min_val, max_val) in enumerate(walk_bounds[area_idx]):
+                state[field_idx] = random_walk_step(state[field_idx], step, min_val, max_val, next_unit())
 
-        current_time += time_step
+            # Store current state as tuple
+            area_timeseries[area_idx].append((timestamp, *state))
 
     # Format output with columnar structure
     columns = ['timestamp', 'precipitation', 'temperature', 'atmospheric_pressure',
                'humidity', 'wind_speed', 'wind_direction']
 
     area_timeseries_output = {}
-    for area in areas:
-        area_timeseries_output[area.name] = {
-            'x': area.x,
-            'y': area.y,
-            'columns': columns,
-            'timeseries': area_timeseries[area.name]
-        }
-
-    # Calculate stats
-    num_timesteps = len(area_timeseries[areas[0].name])
+    for area, timeseries, walk in zip(areas, area_timeseries, precomputed_values):
+        if columnar:
+            if walk is not None:
+                values = walk
+            else:
+                values = [row[1:] for row in timeseries]
+                if np is not None:
+                    values = np.array(values, dtype=value_dtype).reshape(len(timestamps), len(WEATHER_FIELDS))
+            area_timeseries_output[area.name] = {
+                'x': area.x,
+                'y': area.y,
+                'columns': columns,
+                'timestamps': timestamps,
+                'values': values
+            }
+        else:
+            area_timeseries_output[area.name] = {
+                'x': area.x,
+                'y': area.y,
+                'columns': columns,
+                'timeseries': timeseries
+            }
 
     return {
         'status': 'success',
@@ -13,62 +13,298 @@ Output: Interpolated timeseries for named query points
 This metaagent sits between weather_simulation_v2 and weather_to_pyswmm in the pipeline.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import json
-import math
+
+try:
+    import numpy as np
+except ImportError:  # optional - interpolation falls back to the pure-Python loop
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 def _parse_input(data: Any) -> Dict[str, Any]:
-    """Parse input, handling JSON strings"""
+    """Parse input, handling JSON strings (decoded with orjson when installed)"""
     if isinstance(data, str):
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity literals, which only the json module accepts
         return json.loads(data)
     return data
 
 
-def _calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
-    """Calculate Euclidean distance between two points"""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+def _calculate_distance_squared(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Calculate squared Euclidean distance between two points"""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+
+def _idw_weight(distance_squared: float, power: float) -> float:
+    """IDW weight 1 / distance**power, taken straight from the squared distance"""
+    if power == 2.0:
+        return 1.0 / distance_squared
+    return distance_squared ** (-0.5 * power)
+
+
+def _area_timestamps(area: Dict[str, Any]) -> List[Any]:
+    """Timestamps of an observation area, in either the row or columnar layout"""
+    if 'timestamps' in area:
+        return area['timestamps']
+    return [row[0] for row in area['timeseries']]
+
+
+def _area_values(area: Dict[str, Any]) -> Any:
+    """Value rows (timestamp dropped) of an observation area, in either layout"""
+    if 'values' in area:
+        return area['values']
+    return [row[1:] for row in area['timeseries']]
+
+
+def _area_rows(area: Dict[str, Any], num_timesteps: int) -> List[tuple]:
+    """First num_timesteps rows of an observation area as (timestamp, values...) tuples"""
+    values = _area_values(area)[:num_timesteps]
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    return [(timestamp, *row) for timestamp, row in zip(_area_timestamps(area)[:num_timesteps], values)]
+
+
+def _matching_observation(
+    query_x: float,
+    query_y: float,
+    observation_points: List[Dict[str, Any]]
+) -> Optional[int]:
+    """Index of the first observation point within 1e-10 of the query point, if any"""
+    for obs_idx, obs_point in enumerate(observation_points):
+        if abs(obs_point['x'] - query_x) < 1e-10 and abs(obs_point['y'] - query_y) < 1e-10:
+            return obs_idx
+    return None
 
 
-def _interpolate_value(
+def _query_weights(
     query_x: float,
     query_y: float,
     observation_points: List[Dict[str, Any]],
-    value_index: int,
     power: float = 2.0
-) -> float:
+) -> Tuple[List[float], float]:
     """
-    Interpolate a single value using Inverse Distance Weighting (IDW).
+    Compute the Inverse Distance Weighting (IDW) weights for one query point.
+
+    Distances don't change between timesteps or weather parameters, so the
+    weights are computed once per query point and reused for every value.
+    The interpolated value is sum(weight * value) / total_weight.
 
     Args:
         query_x, query_y: Query point coordinates
-        observation_points: List of observation point dicts with x, y, and values
-        value_index: Which value to interpolate from the timeseries tuple
+        observation_points: List of observation point dicts with x and y
         power: IDW power parameter (higher = more emphasis on nearby points)
 
     Returns:
-        Interpolated value
+        Tuple of (weights in observation order, total weight)
     """
     # Check if query point matches an observation point exactly
-    for obs_point in observation_points:
-        if abs(obs_point['x'] - query_x) < 1e-10 and abs(obs_point['y'] - query_y) < 1e-10:
-            # Exact match - return the observation value directly
-            return obs_point['value']
+    obs_idx = _matching_observation(query_x, query_y, observation_points)
+    if obs_idx is not None:
+        # Exact match - use the observation value directly
+        weights = [0.0] * len(observation_points)
+        weights[obs_idx] = 1.0
+        return weights, 1.0
+
+    weights = []
+    for obs_idx, obs_point in enumerate(observation_points):
+        distance_squared = _calculate_distance_squared(query_x, query_y, obs_point['x'], obs_point['y'])
+
+        if distance_squared < 1e-20:  # Essentially zero distance
+            weights = [0.0] * len(observation_points)
+            weights[obs_idx] = 1.0
+            return weights, 1.0
+
+        weights.append(_idw_weight(distance_squared, power))
+
+    return weights, sum(weights)
+
+
+def _idw_weights(
+    obs_xy: 'np.ndarray',
+    query_xy: 'np.ndarray',
+    power: float = 2.0
+) -> 'np.ndarray':
+    """
+    IDW weight matrix from every query point to every observation point.
+
+    Rows are normalized to sum to 1. A query point within 1e-10 of an
+    observation point gets a one-hot row for the first such observation,
+    matching _interpolate_value's exact-match rule.
+
+    Args:
+        obs_xy: Observation coordinates, shape (A, 2)
+        query_xy: Query coordinates, shape (Q, 2)
+        power: IDW power parameter
+
+    Returns:
+        Weights, shape (Q, A)
+    """
+    diff = query_xy[:, None, :] - obs_xy[None, :, :]
+    exact = (np.abs(diff) < 1e-10).all(axis=2)
+
+    distance_squared = (diff * diff).sum(axis=2)
+    with np.errstate(divide='ignore'):
+        if power == 2.0:
+            weights = 1.0 / distance_squared
+        else:
+            weights = distance_squared ** (-0.5 * power)
+
+    matched = exact.any(axis=1)
+    if matched.any():
+        weights[matched] = 0.0
+        weights[matched, exact[matched].argmax(axis=1)] = 1.0
 
-    # Calculate weights using IDW
-    total_weight = 0.0
-    weighted_sum = 0.0
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def _interpolate_numpy(
+    area_timeseries: Dict[str, Any],
+    query_points: Dict[str, Any],
+    num_timesteps: int,
+    power: float = 2.0
+) -> Dict[str, Any]:
+    """
+    Interpolate every query point, timestep and weather column at once with NumPy.
+
+    The observation values form one (A, T, C-1) array and the IDW weights one
+    (Q, A) matrix, computed once, so the whole interpolation is a single
+    tensor contraction.
+
+    Args:
+        area_timeseries: Observation areas from the weather simulation
+        query_points: Query point name -> {'x', 'y'}
+        num_timesteps: Number of timesteps to interpolate
+        power: IDW power parameter
+
+    Returns:
+        Query point name -> {'x', 'y', 'columns', 'timeseries'}
+    """
+    areas = list(area_timeseries.values())
+    first_obs = areas[0]
+    columns = first_obs['columns']
+    timestamps = _area_timestamps(first_obs)[:num_timesteps]
 
-    for obs_point in observation_points:
-        distance = _calculate_distance(query_x, query_y, obs_point['x'], obs_point['y'])
+    # float32 inputs (columnar weather output) are interpolated in float32
+    area_values = [_area_values(area) for area in areas]
+    dtype = np.float32 if all(getattr(v, 'dtype', None) == np.float32 for v in area_values) else float
 
-        if distance < 1e-10:  # Essentially zero distance
-            return obs_point['value']
+    obs_xy = np.array([[area['x'], area['y']] for area in areas], dtype=float)
+    values = np.array(
+        [np.asarray(v, dtype=dtype)[:num_timesteps] for v in area_values],
+        dtype=dtype
+    ).reshape(len(areas), num_timesteps, len(columns) - 1)
 
-        weight = 1.0 / (distance ** power)
-        weighted_sum += weight * obs_point['value']
-        total_weight += weight
+    names = list(query_points)
+    query_xy = np.array([[query_points[n]['x'], query_points[n]['y']] for n in names], dtype=float)
+    query_xy = query_xy.reshape(len(names), 2)
 
-    return weighted_sum / total_weight
+    # One (Q, A) x (A, T*(C-1)) matrix product, laid out column-major per query
+    # so the output tuples can be zipped together from whole columns
+    weights = _idw_weights(obs_xy, query_xy, power).astype(dtype, copy=False)
+    interpolated = np.tensordot(weights, values, axes=(1, 0))
+    interpolated = interpolated.transpose(0, 2, 1).tolist()
+
+    query_timeseries = {}
+    for name, column_values in zip(names, interpolated):
+        query_timeseries[name] = {
+            'x': query_points[name]['x'],
+            'y': query_points[name]['y'],
+            'columns': columns,
+            'timeseries': list(zip(timestamps, *column_values))
+        }
+    return query_timeseries
+
+
+def _interpolate_python(
+    area_timeseries: Dict[str, Any],
+    query_points: Dict[str, Any],
+    num_timesteps: int,
+    power: float = 2.0
+) -> Dict[str, Any]:
+    """
+    Interpolate every query point in pure Python (used when NumPy is not installed).
+
+    Args:
+        area_timeseries: Observation areas from the weather simulation
+        query_points: Query point name -> {'x', 'y'}
+        num_timesteps: Number of timesteps to interpolate
+        power: IDW power parameter
+
+    Returns:
+        Query point name -> {'x', 'y', 'columns', 'timeseries'}
+    """
+    # Interpolate for each query point
+    query_timeseries = {}
+
+    # Save first as a reference
+    first_obs = next(iter(area_timeseries.values()))
+    columns = first_obs['columns']
+
+    observation_points = list(area_timeseries.values())
+
+    # Transpose the observations once: for each timestep, one tuple of area
+    # values per weather parameter (timestamp column skipped)
+    area_series = [_area_values(obs) for obs in observation_points]
+    timestamps = _area_timestamps(first_obs)[:num_timesteps]
+    values_at_time = [
+        list(zip(*(series[timestep_idx] for series in area_series)))
+        for timestep_idx in range(num_timesteps)
+    ]
+
+    for qname, qdata in query_points.items():
+        qx = qdata['x']
+        qy = qdata['y']
+
+        # A query point on an observation point takes its values as they are
+        obs_idx = _matching_observation(qx, qy, observation_points)
+        if obs_idx is not None:
+            query_timeseries[qname] = {
+                'x': qx,
+                'y': qy,
+                'columns': columns,
+                'timeseries': _area_rows(observation_points[obs_idx], num_timesteps)
+            }
+            continue
+
+        # IDW weights depend only on position - compute them once per query point
+        weights, total_weight = _query_weights(qx, qy, observation_points, power)
+
+        interpolated_timeseries = []
+
+        # For each timestep (timestamps come from the first area point, all match)
+        for timestamp, column_values in zip(timestamps, values_at_time):
+
+            # Interpolate each weather parameter with the cached weights
+            interpolated_values = [timestamp]  # Start with timestamp
+
+            for area_values in column_values:
+                weighted_sum = 0.0
+                for weight, value in zip(weights, area_values):
+                    weighted_sum += weight * value
+                interpolated_values.append(weighted_sum / total_weight)
+
+            # Store as tuple
+            interpolated_timeseries.append(tuple(interpolated_values))
+
+        # Store query point timeseries in columnar format
+        query_timeseries[qname] = {
+            'x': qx,
+            'y': qy,
+            'columns': columns,
+            'timeseries': interpolated_timeseries
+        }
+
+    return query_timeseries
 
 
 def on_create(data: Any) -> Dict[str, Any]:
@@ -117,69 +353,26 @@ def on_receive(data: Any) -> Dict[str, Any]:
     total_time_seconds = timeseries_parsed.get('total_time_seconds')
     num_timesteps = timeseries_parsed.get('num_timesteps')
 
-    # Interpolate for each query point
-    query_timeseries = {}
-
-    # Save first as a reference
-    first_obs = next(iter(area_timeseries.values()))
-    columns = first_obs['columns']
-
-    for qname, qdata in query_points_parsed.items():
-        qx = qdata['x']
-        qy = qdata['y']
-
-        interpolated_timeseries = []
-
-        # For each timestep
-        for timestep_idx in range(num_timesteps):
-
-            # Get timestamp from first area point (all have same timestamps)
-            timestamp = first_obs['timeseries'][timestep_idx][0]
-
-            # Prepare area point data for this timestep
-            area_points_at_time = []
-            for area_name, area_data in area_timeseries.items():
-                timeseries_tuple = area_data['timeseries'][timestep_idx]
-                area_points_at_time.append({
-                    'name': area_name,
-                    'x': area_data['x'],
-                    'y': area_data['y'],
-                    'data': timeseries_tuple
-                })
-
-            # Interpolate each weather parameter (skip timestamp at index 0)
-            interpolated_values = [timestamp]  # Start with timestamp
-
-            for col_idx in range(1, len(columns)):  # Skip timestamp column
-                # Build area points with current parameter value
-                area_points_for_param = [
-                    {
-                        'x': area['x'],
-                        'y': area['y'],
-                        'value': area['data'][col_idx]
-                    }
-                    for area in area_points_at_time
-                ]
-
-                # Interpolate this parameter
-                interpolated_value = _interpolate_value(
-                    qx, qy,
-                    area_points_for_param,
-                    col_idx,
-                    2.0
-                )
-                interpolated_values.append(interpolated_value)
-
-            # Store as tuple
-            interpolated_timeseries.append(tuple(interpolated_values))
-
-        # Store query point timeseries in columnar format
-        query_timeseries[qname] = {
-            'x': qx,
-            'y': qy,
-            'columns': columns,
-            'timeseries': interpolated_timeseries
+    observation_points = list(area_timeseries.values())
+
+    if len(observation_points) == 1:
+        # A single observation point needs no weighting: every query point gets its values
+        only_obs = observation_points[0]
+        only_rows = _area_rows(only_obs, num_timesteps)
+        query_timeseries = {
+            qname: {
+                'x': qdata['x'],
+                'y': qdata['y'],
+                'columns': only_obs['columns'],
+                'timeseries': list(only_rows)
+            }
+            for qname, qdata in query_points_parsed.items()
         }
+    elif np is not None:
+        # With NumPy, interpolate everything in one vectorized pass
+        query_timeseries = _interpolate_numpy(area_timeseries, query_points_parsed, num_timesteps)
+    else:
+        query_timeseries = _interpolate_python(area_timeseries, query_points_parsed, num_timesteps)
 
     return {
         'status': 'success',
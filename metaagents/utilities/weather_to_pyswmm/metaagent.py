@@ -19,10 +19,49 @@ The converter:
 - Outputs data ready for pyswmm_simulation metaagent
 """
 
-from typing import Dict, Any, Optional, List
+# --- runtime guard (lets worker processes find this module's functions) ---
+import sys, types
+_loaded_by_guard = not isinstance(__name__, str) or __name__ not in sys.modules
+if _loaded_by_guard:
+    module_name = "xmtwin_runtime_weather_to_pyswmm"  # any stable name unique to this file is fine
+    globals()["__name__"] = module_name
+    # Register a module that resolves names from these globals, so functions
+    # defined below can be pickled by reference for worker processes
+    _guard_globals = globals()
+
+    def _guard_getattr(name):
+        try:
+            return _guard_globals[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    mod = types.ModuleType(module_name)
+    mod.__getattr__ = _guard_getattr
+    sys.modules[module_name] = mod
+# --- end guard ---
+
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import json
+import multiprocessing
+
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:  # optional - timestamps are parsed with datetime.fromisoformat
+    _ciso_parse_datetime = None
+
+try:
+    import orjson
+except ImportError:  # optional - modifications are serialized with the json module
+    orjson = None
+
+
+# Global state
+_config: Dict[str, Any] = {}
+
 
 def _parse_input(data: Any) -> Dict[str, Any]:
     """Parse input data, handling both dict and JSON string formats"""
@@ -31,6 +70,36 @@ def _parse_input(data: Any) -> Dict[str, Any]:
     return data
 
 
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.fromisoformat  # accepts a trailing 'Z' natively
+else:
+    def _fromisoformat(timestamp_str: str) -> datetime:
+        """datetime.fromisoformat, mapping a trailing 'Z' to '+00:00' first"""
+        if timestamp_str.endswith('Z'):
+            timestamp_str = timestamp_str[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp_str)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, with orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys or ints beyond 64 bits, which json accepts
+    return json.dumps(obj)
+
+
+def _parse_iso_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, with ciso8601 when installed (handles 'Z' natively)"""
+    if _ciso_parse_datetime is not None:
+        try:
+            return _ciso_parse_datetime(timestamp_str)
+        except ValueError:
+            pass  # layouts only fromisoformat accepts
+    return _fromisoformat(timestamp_str)
+
+
 def _calculate_swmm_date_range(start_time_str: str, end_time_str: str) -> Dict[str, str]:
     """
     Calculate SWMM date range based on current time and input time difference.
@@ -43,8 +112,8 @@ def _calculate_swmm_date_range(start_time_str: str, end_time_str: str) -> Dict[s
         Dict with start_date, start_time, end_date, end_time in SWMM format
     """
     # Parse input times
-    start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-    end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
+    start_time = _parse_iso_timestamp(start_time_str)
+    end_time = _parse_iso_timestamp(end_time_str)
     
     # Calculate duration
     duration = end_time - start_time
@@ -53,11 +122,12 @@ def _calculate_swmm_date_range(start_time_str: str, end_time_str: str) -> Dict[s
     new_start = datetime.now(timezone.utc)
     new_end = new_start + duration
     
+    # Fixed layouts, so format the fields directly rather than via strftime
     return {
-        'start_date': new_start.strftime('%m/%d/%Y'),
-        'start_time': new_start.strftime('%H:%M:%S'),
-        'end_date': new_end.strftime('%m/%d/%Y'),
-        'end_time': new_end.strftime('%H:%M:%S')
+        'start_date': f"{new_start.month:02d}/{new_start.day:02d}/{new_start.year:04d}",
+        'start_time': f"{new_start.hour:02d}:{new_start.minute:02d}:{new_start.second:02d}",
+        'end_date': f"{new_end.month:02d}/{new_end.day:02d}/{new_end.year:04d}",
+        'end_time': f"{new_end.hour:02d}:{new_end.minute:02d}:{new_end.second:02d}"
     }
 
 def _convert_timestamp_to_swmm(iso_timestamp: str) -> tuple[str, str]:
@@ -70,9 +140,21 @@ def _convert_timestamp_to_swmm(iso_timestamp: str) -> tuple[str, str]:
     Returns:
         Tuple of (date_str, time_str) like ('10/22/2024', '00:00:00')
     """
-    # Handle both 'Z' and '+00:00' timezone formats
-    timestamp_str = iso_timestamp.replace('Z', '+00:00')
-    dt = datetime.fromisoformat(timestamp_str)
+    # Fast path: for the usual YYYY-MM-DDTHH:MM:SS[...] layout both parts are
+    # plain substrings (the wall-clock time is kept as-is, like strftime does)
+    if (
+        len(iso_timestamp) >= 19
+        and iso_timestamp[4] == '-' and iso_timestamp[7] == '-' and iso_timestamp[10] in 'T '
+        and iso_timestamp[13] == ':' and iso_timestamp[16] == ':'
+        and iso_timestamp[19:20] in ('', '.', 'Z', '+', '-')
+    ):
+        return (
+            f"{iso_timestamp[5:7]}/{iso_timestamp[8:10]}/{iso_timestamp[:4]}",
+            iso_timestamp[11:19]
+        )
+
+    # Handles both 'Z' and '+00:00' timezone formats
+    dt = _parse_iso_timestamp(iso_timestamp)
 
     date_str = dt.strftime('%m/%d/%Y')  # MM/DD/YYYY
     time_str = dt.strftime('%H:%M:%S')  # HH:MM:SS
@@ -80,64 +162,132 @@ def _convert_timestamp_to_swmm(iso_timestamp: str) -> tuple[str, str]:
     return date_str, time_str
 
 
-def _format_swmm_line(date_str: str, time_str: str, value: float, decimal_places: int = 2) -> str:
+def _swmm_line_prefix(iso_timestamp: str) -> str:
     """
-    Format a single SWMM timeseries data line.
+    Format the timestamp part of a SWMM timeseries data line.
 
     Format: 'MM/DD/YYYY  HH:MM:SS     VALUE'
     Two spaces between date and time, five spaces between time and value.
+    The value is appended by the caller.
 
     Args:
-        date_str: Date in MM/DD/YYYY format
-        time_str: Time in HH:MM:SS format
-        value: Numeric value
-        decimal_places: Number of decimal places for value
+        iso_timestamp: ISO format timestamp
 
     Returns:
-        Formatted SWMM data line
+        Line prefix like '10/22/2024  00:00:00     '
     """
-    value_formatted = f"{value:.{decimal_places}f}"
-    return f"{date_str}  {time_str}     {value_formatted}"
+    date_str, time_str = _convert_timestamp_to_swmm(iso_timestamp)
+    return f"{date_str}  {time_str}     "
 
 
 def _convert_area_timeseries_to_swmm(
     area_data: Dict[str, Any],
     parameter: str,
-    decimal_places: int = 2
-) -> List[str]:
+    decimal_places: int = 2,
+    timestamp_cache: Optional[Dict[str, str]] = None
+) -> str:
     """
     Convert a single area's columnar timeseries to SWMM format.
 
+    Only the timestamp and parameter columns are read. Besides row tuples in
+    'timeseries', the weather simulation's columnar layout ('timestamps' plus
+    a 'values' matrix without the timestamp column) is accepted as well.
+
     Args:
-        area_data: Dict with 'columns', 'timeseries', 'x', 'y'
+        area_data: Dict with 'columns', 'timeseries' (or 'timestamps' and 'values'), 'x', 'y'
         parameter: Which parameter to extract (e.g., 'precipitation')
         decimal_places: Number of decimal places for values
+        timestamp_cache: ISO timestamp -> SWMM line prefix memo, shared
+            across areas so each distinct timestamp is converted once
 
     Returns:
-        List of SWMM-formatted data lines
+        SWMM-formatted data lines, joined with newlines
     """
     columns = area_data.get('columns', [])
-    timeseries = area_data.get('timeseries', [])
 
-    # Find the index of the desired parameter
-    if parameter not in columns:
+    # Find the index of the desired parameter (usually right after the timestamp)
+    if len(columns) > 1 and columns[1] == parameter:
+        param_idx = 1
+    elif parameter in columns:
+        param_idx = columns.index(parameter)
+    else:
         raise ValueError(f"Parameter '{parameter}' not found in columns: {columns}")
 
-    param_idx = columns.index(parameter)
+    # Extract just the two columns needed
+    if 'timestamps' in area_data:
+        timestamps = area_data['timestamps']
+        values = area_data['values']
+        if hasattr(values, 'tolist'):  # NumPy array
+            values = values[:, param_idx - 1].tolist()
+        else:
+            values = [row[param_idx - 1] for row in values]
+    else:
+        timeseries = area_data.get('timeseries', [])
+        timestamps = [data_tuple[0] for data_tuple in timeseries]  # always the timestamp
+        if param_idx == 1:  # constant index is cheaper than a closure variable
+            values = [data_tuple[1] for data_tuple in timeseries]
+        else:
+            values = [data_tuple[param_idx] for data_tuple in timeseries]
+
+    # Convert only timestamps not seen yet (areas usually share all of them)
+    if timestamp_cache is None:
+        timestamp_cache = {}
+    for timestamp in timestamps:
+        if timestamp not in timestamp_cache:
+            timestamp_cache[timestamp] = _swmm_line_prefix(timestamp)
+
+    # Each line is its cached timestamp prefix plus the formatted value
+    value_format = f".{decimal_places}f"
+    return "\n".join([
+        f"{timestamp_cache[iso_timestamp]}{value:{value_format}}"
+        for iso_timestamp, value in zip(timestamps, values)
+    ])
+
+
+def _process_pool_available() -> bool:
+    """
+    Whether worker processes can run this module's functions.
 
-    # Convert each data point
-    swmm_lines = []
-    for data_tuple in timeseries:
-        # data_tuple[0] is always timestamp
-        # data_tuple[param_idx] is the parameter value
-        iso_timestamp = data_tuple[0]
-        value = data_tuple[param_idx]
+    When the runtime guard registered the module, workers cannot import it by
+    name, so only forked workers (which inherit the registration) can.
+    """
+    return not _loaded_by_guard or "fork" in multiprocessing.get_all_start_methods()
 
-        date_str, time_str = _convert_timestamp_to_swmm(iso_timestamp)
-        line = _format_swmm_line(date_str, time_str, value, decimal_places)
-        swmm_lines.append(line)
 
-    return swmm_lines
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool, forking the workers when the runtime guard registered this module."""
+    if not _loaded_by_guard:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"))
+
+
+def _convert_areas_parallel(
+    timeseries: Dict[str, Dict[str, Any]],
+    parameter: str,
+    max_workers: int
+) -> Dict[str, str]:
+    """
+    Convert areas in worker processes, one area per task.
+
+    The timestamp memo cannot be shared between processes, so each area
+    converts its own timestamps.
+
+    Args:
+        timeseries: Dict of area_name -> area data
+        parameter: Which parameter to extract
+        max_workers: Number of worker processes
+
+    Returns:
+        Dict of area_name -> SWMM data lines joined with newlines
+    """
+    area_names = list(timeseries)
+    with _process_pool(max_workers) as executor:
+        converted = executor.map(
+            _convert_area_timeseries_to_swmm,
+            [timeseries[area_name] for area_name in area_names],
+            repeat(parameter, len(area_names))
+        )
+        return dict(zip(area_names, converted))
 
 def on_create(data: Any) -> Dict[str, Any]:
     """
@@ -149,10 +299,33 @@ def on_create(data: Any) -> Dict[str, Any]:
             - value_multiplier: float = 1.0 - Multiply values by this factor
             - decimal_places: int = 2 - Number of decimal places for values
             - auto_date_range: bool = True - Auto-calculate start/end dates
+            - serialize_modifications: bool = True - Return 'modifications' as a
+              JSON string; False returns the dict itself, skipping an encode and
+              decode of every data line when the consumer accepts a dict
+            - parallel_workers: int = None - Convert areas in this many worker
+              processes; only worth it for many large areas on a multi-core host
+
+    Raises:
+        ValueError: If parallel_workers is not a positive integer, or worker
+            processes cannot run the converter on this platform
 
     Returns:
         Status dict with configuration details
     """
+    config = _parse_input(data) or {}
+    _config['serialize_modifications'] = bool(config.get('serialize_modifications', True))
+
+    parallel_workers = config.get('parallel_workers')
+    if parallel_workers is not None:
+        try:
+            parallel_workers = int(parallel_workers)
+        except (TypeError, ValueError):
+            raise ValueError(f"parallel_workers must be an integer, got: {parallel_workers!r}") from None
+        if parallel_workers < 1:
+            raise ValueError(f"parallel_workers must be at least 1, got: {parallel_workers}")
+        if parallel_workers > 1 and not _process_pool_available():
+            raise ValueError("parallel_workers > 1 needs the 'fork' start method when the metaagent is not importable by name")
+    _config['parallel_workers'] = parallel_workers
 
     return {
         'status': 'initialized',
@@ -174,7 +347,7 @@ def on_receive(data: Any) -> Dict[str, Any]:
         Dict with:
             - status: 'success' or 'error'
             - modifications: Dict ready for pyswmm_simulation on_receive
-                - timeseries: Dict of area_name -> list of SWMM data lines
+                - timeseries: Dict of area_name -> SWMM data lines joined with newlines
                 - options: Dict of SWMM OPTIONS (if auto_date_range or provided)
             - conversion_stats: Statistics about the conversion
     """
@@ -206,16 +379,21 @@ def on_receive(data: Any) -> Dict[str, Any]:
     swmm_dates = _calculate_swmm_date_range(start_time_str, end_time_str)
 
     swmm_timeseries = {}
+    timestamp_cache = {}  # shared by all areas - they normally have the same timestamps
+    parallel_workers = _config.get('parallel_workers')
 
+    if parallel_workers and parallel_workers > 1 and len(timeseries) > 1:
+        swmm_timeseries = _convert_areas_parallel(timeseries, parameter, parallel_workers)
+    else:
+        for area_name, area_data in timeseries.items():
+            # Convert timeseries
+            swmm_lines = _convert_area_timeseries_to_swmm(
+                area_data=area_data,
+                parameter=parameter,
+                timestamp_cache=timestamp_cache
+            )
 
-    for area_name, area_data in timeseries.items():
-        # Convert timeseries
-        swmm_lines = _convert_area_timeseries_to_swmm(
-            area_data=area_data,
-            parameter=parameter
-        )
-
-        swmm_timeseries[area_name] = swmm_lines
+            swmm_timeseries[area_name] = swmm_lines
 
 
     # Build modifications dict for pyswmm_simulation
@@ -235,9 +413,12 @@ def on_receive(data: Any) -> Dict[str, Any]:
 
     #     conversion_stats['date_range'] = date_range
 
+    if _config.get('serialize_modifications', True):
+        modifications = _dumps(modifications)
+
     return {
         'status': 'success',
-        'modifications': json.dumps(modifications)
+        'modifications': modifications
     }
 
 
@@ -248,6 +429,7 @@ def on_destroy(data: Any = None) -> Dict[str, Any]:
     Returns:
         Status dict
     """
+    _config.clear()
 
     return {
         'status': 'destroyed',